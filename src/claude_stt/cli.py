@@ -6,8 +6,6 @@ import argparse
 from typing import Sequence
 
 from . import __version__
-from .daemon import main as daemon_main
-from .setup import main as setup_main
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -40,9 +38,14 @@ def main(argv: Sequence[str] | None = None) -> int:
         print(__version__)
         return 0
 
+    # Subcommands are imported on dispatch so `--version` and `stop` stay cheap.
     if args.command == "setup":
+        from .setup import main as setup_main
+
         return setup_main(list(args.args))
 
+    from .daemon import main as daemon_main
+
     if args.command == "daemon":
         if not args.args:
             parser.print_help()
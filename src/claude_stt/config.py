@@ -3,14 +3,17 @@
 import logging
 import os
 import platform
+import sys
 import tempfile
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
-try:
+# Reads use the stdlib parser on 3.11+; tomli is only needed as a backport.
+if sys.version_info >= (3, 11):
     import tomllib as tomli
-except ImportError:
+else:
     try:
         import tomli
     except ImportError:
@@ -23,6 +26,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Last parsed config keyed by (path, mtime_ns, size) so repeated loads skip the TOML parse.
+_CONFIG_CACHE: tuple[Path, int, int, "Config"] | None = None
+
 
 @dataclass
 class Config:
@@ -35,6 +41,7 @@ class Config:
     # Engine settings
     engine: Literal["moonshine", "whisper"] = "moonshine"
     moonshine_model: str = "moonshine/base"
+    moonshine_precision: Literal["float", "quantized"] = "float"
     whisper_model: str = "medium"
 
     # Audio settings
@@ -44,6 +51,7 @@ class Config:
 
     # Output settings
     output_mode: Literal["injection", "clipboard", "auto"] = "auto"
+    paste_threshold: int = 0  # Inject longer text via clipboard paste; 0 = always type
 
     # Feedback settings
     sound_effects: bool = True
@@ -72,7 +80,12 @@ class Config:
 
     @classmethod
     def load(cls) -> "Config":
-        """Load configuration from file, or return defaults."""
+        """Load configuration from file, or return defaults.
+
+        The parsed result is cached until the file's mtime or size changes;
+        each call returns a fresh copy so callers may mutate it freely.
+        """
+        global _CONFIG_CACHE
         config_path = cls.get_config_path()
         legacy_path = None
         if not config_path.exists():
@@ -84,8 +97,21 @@ class Config:
             logger.warning("tomli not installed; using default config")
             return cls().validate()
 
+        source_path = legacy_path or config_path
+        try:
+            stat = source_path.stat()
+        except OSError:
+            stat = None
+        if stat is not None and _CONFIG_CACHE is not None:
+            cached_path, cached_mtime, cached_size, cached_config = _CONFIG_CACHE
+            if (
+                cached_path == source_path
+                and cached_mtime == stat.st_mtime_ns
+                and cached_size == stat.st_size
+            ):
+                return replace(cached_config)
+
         try:
-            source_path = legacy_path or config_path
             with open(source_path, "rb") as f:
                 data = tomli.load(f)
 
@@ -95,6 +121,9 @@ class Config:
                 mode=stt_config.get("mode", cls.mode),
                 engine=stt_config.get("engine", cls.engine),
                 moonshine_model=stt_config.get("moonshine_model", cls.moonshine_model),
+                moonshine_precision=stt_config.get(
+                    "moonshine_precision", cls.moonshine_precision
+                ),
                 whisper_model=stt_config.get("whisper_model", cls.whisper_model),
                 sample_rate=stt_config.get("sample_rate", cls.sample_rate),
                 max_recording_seconds=stt_config.get(
@@ -102,6 +131,7 @@ class Config:
                 ),
                 audio_device=stt_config.get("audio_device", cls.audio_device),
                 output_mode=stt_config.get("output_mode", cls.output_mode),
+                paste_threshold=stt_config.get("paste_threshold", cls.paste_threshold),
                 sound_effects=stt_config.get("sound_effects", cls.sound_effects),
             )
             config = config.validate()
@@ -113,6 +143,8 @@ class Config:
                     )
                 except Exception:
                     logger.exception("Failed to migrate legacy config")
+            elif stat is not None:
+                _CONFIG_CACHE = (source_path, stat.st_mtime_ns, stat.st_size, replace(config))
             return config
         except Exception:
             # If config is corrupted, return defaults
@@ -121,6 +153,7 @@ class Config:
 
     def save(self) -> bool:
         """Save configuration to file."""
+        global _CONFIG_CACHE
         if tomli_w is None:
             logger.warning("tomli-w not installed; config not saved")
             return False
@@ -134,11 +167,13 @@ class Config:
                 "mode": self.mode,
                 "engine": self.engine,
                 "moonshine_model": self.moonshine_model,
+                "moonshine_precision": self.moonshine_precision,
                 "whisper_model": self.whisper_model,
                 "sample_rate": self.sample_rate,
                 "max_recording_seconds": self.max_recording_seconds,
                 "audio_device": self.audio_device,
                 "output_mode": self.output_mode,
+                "paste_threshold": self.paste_threshold,
                 "sound_effects": self.sound_effects,
             }
         }
@@ -153,6 +188,7 @@ class Config:
                 temp_file = Path(handle.name)
                 tomli_w.dump(data, handle)
             os.replace(temp_file, config_path)
+            _CONFIG_CACHE = None
             return True
         except Exception:
             logger.exception("Failed to save config")
@@ -187,6 +223,13 @@ class Config:
                 self.moonshine_model,
             )
 
+        if self.moonshine_precision not in ("float", "quantized"):
+            logger.warning(
+                "Invalid moonshine_precision '%s'; defaulting to 'float'",
+                self.moonshine_precision,
+            )
+            self.moonshine_precision = "float"
+
         if not isinstance(self.whisper_model, str) or not self.whisper_model.strip():
             logger.warning("Invalid whisper_model; defaulting to 'medium'")
             self.whisper_model = "medium"
@@ -195,6 +238,19 @@ class Config:
             logger.warning("Invalid output_mode '%s'; defaulting to 'auto'", self.output_mode)
             self.output_mode = "auto"
 
+        try:
+            self.paste_threshold = int(self.paste_threshold)
+        except (TypeError, ValueError):
+            logger.warning(
+                "Invalid paste_threshold '%s'; defaulting to %s",
+                self.paste_threshold,
+                Config.paste_threshold,
+            )
+            self.paste_threshold = Config.paste_threshold
+        if self.paste_threshold < 0:
+            logger.warning("paste_threshold cannot be negative; clamping to 0")
+            self.paste_threshold = 0
+
         if not isinstance(self.sound_effects, bool):
             if isinstance(self.sound_effects, str):
                 self.sound_effects = self.sound_effects.strip().lower() in (
@@ -230,6 +286,7 @@ class Config:
         return self
 
 
+@lru_cache(maxsize=1)
 def get_platform() -> str:
     """Get the current platform identifier."""
     return {
@@ -239,8 +296,13 @@ def get_platform() -> str:
     }.get(platform.system(), "unknown")
 
 
+@lru_cache(maxsize=1)
 def is_wayland() -> bool:
-    """Check if running under Wayland on Linux."""
+    """Check if running under Wayland on Linux.
+
+    The session type cannot change under a running process, so the result is
+    cached.
+    """
     if get_platform() != "linux":
         return False
     return os.environ.get("XDG_SESSION_TYPE") == "wayland"
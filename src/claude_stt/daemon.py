@@ -5,23 +5,23 @@ import json
 import logging
 import os
 import platform
+import select
 import signal
 import subprocess
 import sys
-import tempfile
 import time
 from pathlib import Path
 from typing import Optional
 
 from .config import Config
-from .engine_factory import build_engine
 from .errors import EngineError, HotkeyError
-from .hotkey import HotkeyListener
-from .keyboard import test_injection
-from .daemon_service import STTDaemon
 
 logger = logging.getLogger(__name__)
 
+# How long an unreadable PID file is left alone, in case another start has
+# created it but not yet written its pid.
+_PID_FILE_WRITE_GRACE = 2.0
+
 
 def get_pid_file() -> Path:
     """Get the PID file path."""
@@ -62,32 +62,62 @@ def _read_pid_file() -> Optional[dict]:
         return None
 
 
-def _write_pid_file(pid: int) -> None:
-    data = {
+def _pid_file_data(pid: int) -> dict:
+    return {
         "pid": pid,
         "command": " ".join(sys.argv),
         "created_at": time.time(),
         "config_dir": str(Config.get_config_dir()),
     }
+
+
+def _claim_pid_file(pid: int) -> bool:
+    """Atomically create the PID file for this process.
+
+    O_EXCL makes the check and the write a single step, so two concurrent
+    starts cannot both claim the daemon slot. A stale file is removed by
+    is_daemon_running(), an unreadable one by _discard_unreadable_pid_file(),
+    and the claim retried once.
+
+    Returns:
+        True if the PID file was created, False if another daemon holds it.
+    """
     pid_file = get_pid_file()
     pid_file.parent.mkdir(parents=True, exist_ok=True)
-    temp_file = None
+    payload = json.dumps(_pid_file_data(pid)).encode("utf-8")
+    for _ in range(2):
+        try:
+            fd = os.open(pid_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            if is_daemon_running():
+                return False
+            if _read_pid_file() is None:
+                _discard_unreadable_pid_file(pid_file)
+            continue
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        return True
+    return False
+
+
+def _discard_unreadable_pid_file(pid_file: Path) -> None:
+    """Remove a PID file that holds no pid, e.g. after a crash mid-claim."""
     try:
-        with tempfile.NamedTemporaryFile(
-            "w",
-            delete=False,
-            dir=str(pid_file.parent),
-            encoding="utf-8",
-        ) as handle:
-            temp_file = Path(handle.name)
-            handle.write(json.dumps(data))
-        os.replace(temp_file, pid_file)
-    finally:
-        if temp_file and temp_file.exists():
-            try:
-                temp_file.unlink()
-            except OSError:
-                pass
+        age = time.time() - pid_file.stat().st_mtime
+    except FileNotFoundError:
+        return
+    if age < _PID_FILE_WRITE_GRACE:
+        # A concurrent start may be between O_EXCL and its write.
+        time.sleep(_PID_FILE_WRITE_GRACE - age)
+        if _read_pid_file() is not None:
+            return
+    logger.warning("Removing unreadable PID file: %s", pid_file)
+    try:
+        pid_file.unlink()
+    except FileNotFoundError:
+        pass
 
 
 def is_daemon_running() -> bool:
@@ -289,9 +319,14 @@ def start_daemon(background: bool = False):
             "Background spawn failed; running in foreground"
         )
 
-    _write_pid_file(os.getpid())
+    if not _claim_pid_file(os.getpid()):
+        logger.info("Daemon is already running.")
+        return
 
     try:
+        # Imported here so stop/status/toggle never load the audio and engine stack.
+        from .daemon_service import STTDaemon
+
         daemon = STTDaemon()
         daemon.run()
     finally:
@@ -342,22 +377,25 @@ def stop_daemon():
             )
             pid_file.unlink(missing_ok=True)
             return
-        if not _terminate_process(pid):
-            logger.warning(
-                "Failed to signal daemon (PID %s); leaving PID file intact", pid
-            )
-            return
-        logger.info("Sent stop signal to daemon (PID %s)", pid)
-
-        # Wait for it to stop
-        for _ in range(50):  # 5 seconds
-            time.sleep(0.1)
-            if not _pid_exists(pid):
+        # Open the pidfd before signalling so a recycled PID cannot be mistaken.
+        pidfd = _open_pidfd(pid)
+        try:
+            if not _terminate_process(pid):
+                logger.warning(
+                    "Failed to signal daemon (PID %s); leaving PID file intact", pid
+                )
+                return
+            logger.info("Sent stop signal to daemon (PID %s)", pid)
+
+            # Wait for it to stop
+            if _wait_for_exit(pid, 5.0, pidfd):
                 logger.info("Daemon stopped.")
-                break
-        else:
-            logger.warning("Daemon did not stop gracefully, forcing...")
-            _force_kill(pid)
+            else:
+                logger.warning("Daemon did not stop gracefully, forcing...")
+                _force_kill(pid)
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
 
     except PermissionError:
         logger.warning(
@@ -371,6 +409,41 @@ def stop_daemon():
         pid_file.unlink(missing_ok=True)
 
 
+def _open_pidfd(pid: int) -> Optional[int]:
+    """Open a pidfd for pid (Linux 5.3+), or None when unsupported."""
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return None
+    try:
+        return pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def _wait_for_exit(pid: int, timeout: float, pidfd: Optional[int] = None) -> bool:
+    """Wait up to timeout seconds for pid to exit.
+
+    With a pidfd the kernel wakes us as soon as the process exits; otherwise
+    fall back to polling every 100ms.
+
+    Returns:
+        True if the process exited within the timeout.
+    """
+    if pidfd is not None:
+        try:
+            ready, _, _ = select.select([pidfd], [], [], timeout)
+            return bool(ready)
+        except OSError:
+            logger.debug("pidfd wait failed; polling instead", exc_info=True)
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(0.1)
+        if not _pid_exists(pid):
+            return True
+    return False
+
+
 def _terminate_process(pid: int) -> bool:
     if os.name == "nt":
         return _taskkill(pid, force=False)
@@ -412,6 +485,10 @@ def _taskkill(pid: int, force: bool) -> bool:
 
 def daemon_status():
     """Print daemon status."""
+    from .engine_factory import build_engine
+    from .hotkey import HotkeyListener
+    from .keyboard import test_injection
+
     running = is_daemon_running()
     if running:
         data = _read_pid_file()
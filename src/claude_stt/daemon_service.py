@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import queue
 import signal
 import threading
@@ -18,7 +19,7 @@ from .errors import EngineError, HotkeyError, RecorderError
 from .hotkey import HotkeyListener
 from .keyboard import output_text
 from .recorder import AudioRecorder, RecorderConfig
-from .sounds import play_sound
+from .sounds import SoundEvent, play_sound, preload_sounds
 from .window import get_active_window, WindowInfo
 
 
@@ -42,6 +43,8 @@ class STTDaemon:
 
         # Recording state
         self._record_start_time: float = 0
+        self._record_session = 0
+        self._record_timers: list[threading.Timer] = []
         self._original_window: Optional[WindowInfo] = None
         # Threading
         self._lock = threading.Lock()
@@ -112,12 +115,9 @@ class STTDaemon:
         self._transcribe_thread.start()
 
     def _transcribe_worker(self) -> None:
-        while not self._stop_event.is_set():
-            try:
-                item = self._transcribe_queue.get(timeout=0.1)
-            except queue.Empty:
-                continue
-
+        # Block until work or the shutdown sentinel arrives; no idle polling.
+        while True:
+            item = self._transcribe_queue.get()
             if item is None:
                 break
 
@@ -138,8 +138,7 @@ class STTDaemon:
             text = text.strip()
             if not text:
                 self._logger.info("No speech detected")
-                if self.config.sound_effects:
-                    play_sound("warning")
+                self._play_feedback("warning")
                 continue
 
             display_text = text[:100] + "..." if len(text) > 100 else text
@@ -147,38 +146,61 @@ class STTDaemon:
             if not output_text(text, window_info, self.config):
                 self._logger.warning("Failed to output transcription")
 
+    def _play_feedback(self, event: SoundEvent) -> None:
+        """Play a feedback sound; playback never blocks the caller."""
+        if not self.config.sound_effects:
+            return
+        play_sound(event)
+
     def _on_recording_start(self):
         """Called when recording should start."""
+        # Unlocked fast path; the flag is checked again under the lock.
+        if self._recording:
+            return
+
+        # Capture the active window before taking the lock: it may shell out.
+        window_info = get_active_window()
+
         with self._lock:
             if self._recording:
                 return
 
             self._recording = True
             self._record_start_time = time.time()
-
-            # Capture the active window
-            self._original_window = get_active_window()
+            self._record_session += 1
+            self._original_window = window_info
 
             # Start recording
-            if self._recorder and self._recorder.start():
-                self._logger.info("Recording started")
-                if self.config.sound_effects:
-                    play_sound("start")
+            started = bool(self._recorder and self._recorder.start())
+            if started:
+                self._schedule_recording_timers(self._record_session)
             else:
-                self._logger.error("Audio recorder failed to start")
                 self._recording = False
-                if self.config.sound_effects:
-                    play_sound("error")
 
-    def _on_recording_stop(self):
-        """Called when recording should stop."""
+        if started:
+            self._logger.info("Recording started")
+            self._play_feedback("start")
+        else:
+            self._logger.error("Audio recorder failed to start")
+            self._play_feedback("error")
+
+    def _on_recording_stop(self, session: Optional[int] = None):
+        """Called when recording should stop.
+
+        Args:
+            session: Only stop if this recording session is still active.
+                Used by the max-duration timer; hotkey stops pass None.
+        """
         audio = None
         window_info = None
         with self._lock:
             if not self._recording:
                 return
+            if session is not None and session != self._record_session:
+                return
 
             self._recording = False
+            self._cancel_recording_timers()
             elapsed = time.time() - self._record_start_time
 
             # Stop recording
@@ -186,9 +208,8 @@ class STTDaemon:
                 audio = self._recorder.stop()
             window_info = self._original_window
 
-            self._logger.info("Recording stopped (%.1fs)", elapsed)
-            if self.config.sound_effects:
-                play_sound("stop")
+        self._logger.info("Recording stopped (%.1fs)", elapsed)
+        self._play_feedback("stop")
 
         # Transcribe outside the lock
         if audio is not None and len(audio) > 0:
@@ -196,24 +217,33 @@ class STTDaemon:
                 self._transcribe_queue.put_nowait((audio, window_info))
             except queue.Full:
                 self._logger.warning("Dropping transcription; queue is full")
-        elif self.config.sound_effects:
-            play_sound("warning")
-
-    def _check_max_recording_time(self) -> None:
-        """Check if max recording time has been reached."""
-        if not self._recording:
-            return
+        else:
+            self._play_feedback("warning")
 
-        elapsed = time.time() - self._record_start_time
+    def _schedule_recording_timers(self, session: int) -> None:
+        """Arm the max-duration warning and auto-stop. Caller holds the lock."""
         max_seconds = self.config.max_recording_seconds
+        timers = []
 
         # Warning at 30 seconds before max
-        if max_seconds > 30 and max_seconds - 30 <= elapsed < max_seconds - 29:
-            if self.config.sound_effects:
-                play_sound("warning")
+        if max_seconds > 30:
+            timers.append(
+                threading.Timer(max_seconds - 30, self._play_feedback, args=("warning",))
+            )
+        timers.append(
+            threading.Timer(max_seconds, self._on_recording_stop, kwargs={"session": session})
+        )
+
+        for timer in timers:
+            timer.daemon = True
+            timer.start()
+        self._record_timers = timers
 
-        if elapsed >= max_seconds:
-            self._on_recording_stop()
+    def _cancel_recording_timers(self) -> None:
+        """Cancel pending max-duration timers. Caller holds the lock."""
+        for timer in self._record_timers:
+            timer.cancel()
+        self._record_timers = []
 
     def run(self):
         """Run the daemon main loop."""
@@ -230,6 +260,9 @@ class STTDaemon:
         if not self._engine.load_model():
             self._logger.error("Failed to load STT model")
             raise SystemExit(1)
+        self._engine.warmup()
+        if self.config.sound_effects:
+            preload_sounds()
 
         self._logger.info("Model loaded. Ready for voice input.")
 
@@ -244,6 +277,7 @@ class STTDaemon:
         def shutdown(signum, frame):
             self._logger.info("Shutting down...")
             self._running = False
+            self._stop_event.set()
 
         def toggle_recording(signum, frame):
             if self._recording:
@@ -263,11 +297,12 @@ class STTDaemon:
         except Exception:
             self._logger.debug("Signal handlers unavailable", exc_info=True)
 
-        # Main loop
+        # Main loop: sleep until shutdown; recording limits run on timers.
+        # Windows cannot interrupt a blocking wait with Ctrl+C, so wake there.
+        wait_timeout = 1.0 if os.name == "nt" else None
         try:
             while self._running:
-                self._check_max_recording_time()
-                time.sleep(0.1)
+                self._stop_event.wait(wait_timeout)
         finally:
             self.stop()
 
@@ -276,16 +311,18 @@ class STTDaemon:
         self._running = False
         self._stop_event.set()
 
-        try:
-            self._transcribe_queue.put_nowait(None)
-        except queue.Full:
-            pass
-
         if self._transcribe_thread:
+            try:
+                self._transcribe_queue.put(None, timeout=1.0)
+            except queue.Full:
+                self._logger.debug("Transcribe queue full; worker not signalled")
+
             self._transcribe_thread.join(timeout=1.0)
             if self._transcribe_thread.is_alive():
                 self._logger.warning("Transcribe thread did not exit cleanly")
 
+        with self._lock:
+            self._cancel_recording_timers()
         if self._recording and self._recorder:
             self._recorder.stop()
 
@@ -1,7 +1,11 @@
 """STT engine implementations."""
 
-from typing import Protocol
-import numpy as np
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class STTEngine(Protocol):
@@ -26,3 +30,7 @@ class STTEngine(Protocol):
     def load_model(self) -> bool:
         """Load the model. Returns True if successful."""
         ...
+
+    def warmup(self) -> None:
+        """Run a throwaway inference so the first transcription is fast."""
+        ...
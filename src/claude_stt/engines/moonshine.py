@@ -4,17 +4,14 @@ from typing import Optional
 import logging
 import numpy as np
 
-# Try to import moonshine
-_moonshine_available = False
-_transcribe_fn = None
-_MoonshineModel = None
+# moonshine_onnx pulls in onnxruntime, so it is imported on the first
+# availability check or model load rather than at module import.
+_moonshine_available: Optional[bool] = None
 
-try:
-    from moonshine_onnx.transcribe import transcribe as _transcribe_fn
-    from moonshine_onnx import MoonshineOnnxModel as _MoonshineModel
-    _moonshine_available = True
-except ImportError:
-    pass
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+# Initial streaming buffer size: 30 seconds at 16kHz. Grows by doubling.
+_STREAM_INITIAL_SAMPLES = 30 * 16000
 
 
 class MoonshineEngine:
@@ -26,20 +23,38 @@ class MoonshineEngine:
     Models:
         - moonshine/tiny: ~190MB, fastest
         - moonshine/base: ~400MB, better accuracy
+
+    Both come in "float" and 8-bit "quantized" weights; the quantized
+    variants are several times smaller and faster on CPU.
     """
 
-    def __init__(self, model_name: str = "moonshine/base"):
+    def __init__(self, model_name: str = "moonshine/base", precision: str = "float"):
         """Initialize the Moonshine engine.
 
         Args:
             model_name: Model to use ("moonshine/tiny" or "moonshine/base").
+            precision: Weight precision ("float" or "quantized").
         """
         self.model_name = model_name
+        self.precision = precision
         self._model: Optional[object] = None
+        self._tokenizer: Optional[object] = None
+        self._assert_audio_size = None
+        self._stream_buf: Optional[np.ndarray] = None
+        self._stream_len = 0
         self._logger = logging.getLogger(__name__)
 
     def is_available(self) -> bool:
         """Check if Moonshine is available."""
+        global _moonshine_available
+        if _moonshine_available is None:
+            try:
+                import moonshine_onnx  # noqa: F401
+                _moonshine_available = True
+            except Exception:
+                # Also covers a broken onnxruntime or tokenizers install.
+                self._logger.debug("moonshine_onnx import failed", exc_info=True)
+                _moonshine_available = False
         return _moonshine_available
 
     def load_model(self) -> bool:
@@ -57,12 +72,24 @@ class MoonshineEngine:
             return True
 
         try:
-            self._model = _MoonshineModel(model_name=self.model_name)
-            return True
+            from moonshine_onnx import MoonshineOnnxModel, load_tokenizer
+            from moonshine_onnx.transcribe import assert_audio_size
+
+            model = MoonshineOnnxModel(
+                model_name=self.model_name,
+                model_precision=self.precision,
+            )
+            tokenizer = load_tokenizer()
         except Exception:
             self._logger.exception("Failed to load Moonshine model")
             return False
 
+        # Publish together so a failed load never leaves a half-ready engine.
+        self._tokenizer = tokenizer
+        self._assert_audio_size = assert_audio_size
+        self._model = model
+        return True
+
     def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
         """Transcribe audio to text.
 
@@ -77,17 +104,32 @@ class MoonshineEngine:
             return ""
 
         try:
-            # Moonshine expects float32 audio normalized to [-1, 1]
-            if audio.dtype != np.float32:
-                audio = audio.astype(np.float32)
-
-            # Normalize if needed
-            max_val = np.abs(audio).max()
-            if max_val > 1.0:
-                audio = audio / max_val
-
-            # Use the transcribe function from moonshine_onnx
-            result = _transcribe_fn(audio, model=self._model)
+            # Moonshine expects float32 audio normalized to [-1, 1].
+            if audio.dtype == np.int16:
+                # PCM is already full-scale: one fused multiply casts and scales.
+                audio = np.multiply(audio, _INT16_SCALE, dtype=np.float32)
+            else:
+                # ascontiguousarray only copies when the dtype or layout differs.
+                prepared = np.ascontiguousarray(audio, dtype=np.float32)
+                owned = not np.may_share_memory(prepared, audio)
+
+                # Peak from max/min avoids allocating an np.abs() temporary.
+                max_val = max(float(prepared.max()), -float(prepared.min()))
+                if max_val > 1.0:
+                    scale = np.float32(1.0 / max_val)
+                    if owned:
+                        np.multiply(prepared, scale, out=prepared)
+                    else:
+                        # Never scale the caller's buffer in place.
+                        prepared = prepared * scale
+                audio = prepared
+
+            # Same steps as moonshine_onnx.transcribe(), but reusing the
+            # tokenizer loaded with the model instead of re-reading it per call.
+            batch = audio[None, ...]
+            self._assert_audio_size(batch)
+            tokens = self._model.generate(batch)
+            result = self._tokenizer.decode_batch(tokens)
 
             # Result is a list of strings (batch results)
             if isinstance(result, list) and len(result) > 0:
@@ -101,27 +143,55 @@ class MoonshineEngine:
             self._logger.exception("Transcription failed")
             return ""
 
-    def transcribe_streaming(
-        self,
-        audio_chunks: list[np.ndarray],
-        sample_rate: int = 16000,
-    ) -> str:
-        """Transcribe accumulated audio chunks.
+    def warmup(self) -> None:
+        """Run one silent inference so ONNX Runtime's lazy initialization is
+        paid at startup rather than on the first real transcription."""
+        if not self.load_model():
+            return
+        try:
+            self._model.generate(np.zeros((1, 16000), dtype=np.float32))
+        except Exception:
+            self._logger.debug("Moonshine warmup failed", exc_info=True)
+
+    def append_chunk(self, chunk: np.ndarray) -> None:
+        """Append an audio chunk to the streaming buffer.
 
-        For streaming, we accumulate chunks and re-transcribe the whole buffer.
-        This gives us updated results as more audio comes in.
+        Chunks are copied into a single preallocated float32 buffer, so
+        streaming updates never re-concatenate the whole recording.
+
+        Args:
+            chunk: Audio chunk (mono).
+        """
+        chunk = np.ravel(chunk)
+        end = self._stream_len + chunk.size
+        if self._stream_buf is None or end > self._stream_buf.size:
+            current = 0 if self._stream_buf is None else self._stream_buf.size
+            grown = np.empty(max(end, current * 2, _STREAM_INITIAL_SAMPLES), dtype=np.float32)
+            if self._stream_len:
+                grown[: self._stream_len] = self._stream_buf[: self._stream_len]
+            self._stream_buf = grown
+        self._stream_buf[self._stream_len : end] = chunk
+        self._stream_len = end
+
+    def reset_stream(self) -> None:
+        """Discard buffered streaming audio, keeping the allocation for reuse."""
+        self._stream_len = 0
+
+    def transcribe_streaming(self, sample_rate: int = 16000) -> str:
+        """Transcribe all audio appended since the last reset.
+
+        For streaming, we accumulate chunks with append_chunk() and
+        re-transcribe the whole buffer. This gives us updated results as more
+        audio comes in.
 
         Args:
-            audio_chunks: List of audio chunks.
             sample_rate: Sample rate.
 
         Returns:
             Current transcription of all audio so far.
         """
-        if not audio_chunks:
+        if not self._stream_len:
             return ""
 
-        # Concatenate all chunks
-        audio = np.concatenate(audio_chunks)
-
-        return self.transcribe(audio, sample_rate)
+        # Pass a view of the buffer; transcribe() never writes to its input.
+        return self.transcribe(self._stream_buf[: self._stream_len], sample_rate)
@@ -56,6 +56,16 @@ class WhisperEngine:
             self._logger.exception("Failed to load Whisper model")
             return False
 
+    def warmup(self) -> None:
+        if not self.load_model():
+            return
+        try:
+            segments, _info = self._model.transcribe(np.zeros(16000, dtype=np.float32))
+            for _segment in segments:
+                pass
+        except Exception:
+            self._logger.debug("Whisper warmup failed", exc_info=True)
+
     def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
         if not self.load_model():
             return ""
@@ -17,6 +17,25 @@ except Exception as exc:
 
 from .errors import HotkeyError
 
+_IS_MACOS = platform.system() == "Darwin"
+
+# Friendly hotkey names mapped to pynput's <name> syntax, built once at import.
+_KEY_NAME_MAP = {
+    "ctrl": "<ctrl>",
+    "control": "<ctrl>",
+    "shift": "<shift>",
+    "alt": "<alt>",
+    "cmd": "<cmd>",
+    "command": "<cmd>",
+    "space": "<space>",
+    "enter": "<enter>",
+    "return": "<enter>",
+    "tab": "<tab>",
+    "esc": "<esc>",
+    "escape": "<esc>",
+}
+_KEY_NAME_MAP.update({f"f{number}": f"<f{number}>" for number in range(1, 25)})
+
 
 class HotkeyListener:
     """Listens for global hotkey events.
@@ -46,7 +65,7 @@ class HotkeyListener:
 
         self._listener: Optional[keyboard.Listener] = None
         self._is_recording = False
-        self._pressed_keys: set = set()
+        self._pressed_mask = 0
         self._hotkey_active = False
         self._lock = threading.Lock()
         self._logger = logging.getLogger(__name__)
@@ -54,7 +73,6 @@ class HotkeyListener:
             queue.Queue(maxsize=8)
         )
         self._worker_thread: Optional[threading.Thread] = None
-        self._worker_stop = threading.Event()
 
         if not _PYNPUT_AVAILABLE:
             message = "pynput unavailable; hotkeys cannot be registered"
@@ -67,6 +85,19 @@ class HotkeyListener:
         if not self._hotkey_keys:
             raise HotkeyError(f"Hotkey '{hotkey}' did not map to any keys")
 
+        # One bit per hotkey key; the combination is held when every bit is set.
+        self._key_bits = {key: 1 << index for index, key in enumerate(self._hotkey_keys)}
+        self._hotkey_mask = (1 << len(self._key_bits)) - 1
+        self._build_key_lookup()
+
+        # The mode never changes, so bind the matching handlers once.
+        if mode == "toggle":
+            self._on_press = self._on_press_toggle
+            self._on_release = self._on_release_toggle
+        else:
+            self._on_press = self._on_press_push_to_talk
+            self._on_release = self._on_release_push_to_talk
+
     def _parse_hotkey(self, hotkey_str: str) -> set:
         """Parse hotkey string to a set of keys.
 
@@ -92,46 +123,62 @@ class HotkeyListener:
                 normalized.add(normalized_key)
         return normalized
 
+    def _build_key_lookup(self) -> None:
+        """Precompute bits for the raw keys pynput reports.
+
+        Lets the event handlers resolve a key with one dict lookup instead of
+        normalizing it (and allocating a KeyCode) on every event.
+        """
+        self._char_bits: dict[str, int] = {}
+        self._raw_key_bits: dict = {}
+        for key, bit in self._key_bits.items():
+            char = getattr(key, "char", None)
+            if char:
+                self._char_bits[char] = bit
+            else:
+                self._raw_key_bits[key] = bit
+
+        variants = (
+            (keyboard.Key.ctrl, (keyboard.Key.ctrl_l, keyboard.Key.ctrl_r)),
+            (keyboard.Key.shift, (keyboard.Key.shift_l, keyboard.Key.shift_r)),
+            (keyboard.Key.alt, (keyboard.Key.alt_l, keyboard.Key.alt_r)),
+            (keyboard.Key.cmd, (keyboard.Key.cmd_l, keyboard.Key.cmd_r)),
+        )
+        for base, sides in variants:
+            if base in self._raw_key_bits:
+                for side in sides:
+                    self._raw_key_bits[side] = self._raw_key_bits[base]
+
+        # Space and enter may also arrive as character events.
+        if keyboard.Key.space in self._raw_key_bits:
+            self._char_bits[" "] = self._raw_key_bits[keyboard.Key.space]
+        if keyboard.Key.enter in self._raw_key_bits:
+            self._char_bits["\n"] = self._raw_key_bits[keyboard.Key.enter]
+            self._char_bits["\r"] = self._raw_key_bits[keyboard.Key.enter]
+
+    def _key_bit(self, key) -> int:
+        """Return the hotkey bit for a raw key event, or 0 if not in the hotkey."""
+        char = getattr(key, "char", None)
+        if char:
+            return self._char_bits.get(char.lower(), 0)
+        bit = self._raw_key_bits.get(key)
+        if bit is not None:
+            return bit
+        # Rare: vk-only key codes that need full normalization.
+        return self._key_bits.get(self._normalize_key(key), 0)
+
     def _normalize_hotkey_string(self, hotkey_str: str) -> str:
         parts = [part.strip() for part in hotkey_str.split("+") if part.strip()]
         if not parts:
             return hotkey_str
 
-        key_map = {
-            "ctrl": "<ctrl>",
-            "control": "<ctrl>",
-            "shift": "<shift>",
-            "alt": "<alt>",
-            "cmd": "<cmd>",
-            "command": "<cmd>",
-            "space": "<space>",
-            "enter": "<enter>",
-            "return": "<enter>",
-            "tab": "<tab>",
-            "esc": "<esc>",
-            "escape": "<esc>",
-        }
-
-        normalized_parts = []
-        for part in parts:
-            lowered = part.lower()
-            if lowered.startswith("<") and lowered.endswith(">"):
-                normalized_parts.append(lowered)
-                continue
-            if lowered in key_map:
-                normalized_parts.append(key_map[lowered])
-                continue
-            if lowered.startswith("f") and lowered[1:].isdigit():
-                normalized_parts.append(f"<{lowered}>")
-                continue
-            normalized_parts.append(lowered)
-
-        return "+".join(normalized_parts)
+        # Names already in <...> form and single characters pass through as-is.
+        lowered_parts = (part.lower() for part in parts)
+        return "+".join(_KEY_NAME_MAP.get(part, part) for part in lowered_parts)
 
     def _ensure_worker(self) -> None:
         if self._worker_thread and self._worker_thread.is_alive():
             return
-        self._worker_stop.clear()
         self._worker_thread = threading.Thread(
             target=self._event_worker,
             name="claude-stt-hotkey-worker",
@@ -140,11 +187,9 @@ class HotkeyListener:
         self._worker_thread.start()
 
     def _event_worker(self) -> None:
-        while not self._worker_stop.is_set():
-            try:
-                item = self._event_queue.get(timeout=0.1)
-            except queue.Empty:
-                continue
+        # Block until an event or the shutdown sentinel arrives; no idle polling.
+        while True:
+            item = self._event_queue.get()
             if item is None:
                 return
             label, callback = item
@@ -181,7 +226,7 @@ class HotkeyListener:
             except Exception:
                 pass
 
-            if platform.system() == "Darwin":
+            if _IS_MACOS:
                 mac_vk_map = {
                     49: keyboard.Key.space,
                     36: keyboard.Key.enter,
@@ -203,50 +248,63 @@ class HotkeyListener:
 
         return key
 
-    def _on_press(self, key):
-        """Handle key press event."""
-        normalized = self._normalize_key(key)
-        if normalized is None:
+    def _on_press_toggle(self, key):
+        """Handle key press event in toggle mode: press to start/stop."""
+        bit = self._key_bit(key)
+        if not bit:
+            # Keys outside the hotkey cannot complete the combination.
             return
 
         with self._lock:
-            self._pressed_keys.add(normalized)
-
-            # Check if hotkey combination is pressed
-            if self._hotkey_keys.issubset(self._pressed_keys):
-                if self._hotkey_active:
-                    return
-                self._hotkey_active = True
-                if self.mode == "toggle":
-                    # Toggle mode: press to start/stop
-                    if not self._is_recording:
-                        self._is_recording = True
-                        self._enqueue_event("start", self.on_start)
-                    else:
-                        self._is_recording = False
-                        self._enqueue_event("stop", self.on_stop)
-                else:
-                    # Push-to-talk: press to start
-                    if not self._is_recording:
-                        self._is_recording = True
-                        self._enqueue_event("start", self.on_start)
-
-    def _on_release(self, key):
-        """Handle key release event."""
-        normalized = self._normalize_key(key)
-        if normalized is None:
+            self._pressed_mask |= bit
+            if self._pressed_mask != self._hotkey_mask or self._hotkey_active:
+                return
+            self._hotkey_active = True
+            if not self._is_recording:
+                self._is_recording = True
+                self._enqueue_event("start", self.on_start)
+            else:
+                self._is_recording = False
+                self._enqueue_event("stop", self.on_stop)
+
+    def _on_release_toggle(self, key):
+        """Handle key release event in toggle mode."""
+        bit = self._key_bit(key)
+        if not bit:
             return
 
         with self._lock:
-            self._pressed_keys.discard(normalized)
-            if normalized in self._hotkey_keys:
-                self._hotkey_active = False
+            self._pressed_mask &= ~bit
+            self._hotkey_active = False
+
+    def _on_press_push_to_talk(self, key):
+        """Handle key press event in push-to-talk mode: press to start."""
+        bit = self._key_bit(key)
+        if not bit:
+            # Keys outside the hotkey cannot complete the combination.
+            return
 
-            # In push-to-talk mode, release any hotkey key to stop
-            if self.mode == "push-to-talk" and self._is_recording:
-                if normalized in self._hotkey_keys:
-                    self._is_recording = False
-                    self._enqueue_event("stop", self.on_stop)
+        with self._lock:
+            self._pressed_mask |= bit
+            if self._pressed_mask != self._hotkey_mask or self._hotkey_active:
+                return
+            self._hotkey_active = True
+            if not self._is_recording:
+                self._is_recording = True
+                self._enqueue_event("start", self.on_start)
+
+    def _on_release_push_to_talk(self, key):
+        """Handle key release event in push-to-talk mode: release any hotkey key to stop."""
+        bit = self._key_bit(key)
+        if not bit:
+            return
+
+        with self._lock:
+            self._pressed_mask &= ~bit
+            self._hotkey_active = False
+            if self._is_recording:
+                self._is_recording = False
+                self._enqueue_event("stop", self.on_stop)
 
     def start(self) -> bool:
         """Start listening for hotkeys.
@@ -281,14 +339,13 @@ class HotkeyListener:
         if self._listener is not None:
             self._listener.stop()
             self._listener = None
-            self._pressed_keys.clear()
+            self._pressed_mask = 0
             self._is_recording = False
-        self._worker_stop.set()
-        try:
-            self._event_queue.put_nowait(None)
-        except queue.Full:
-            pass
         if self._worker_thread:
+            try:
+                self._event_queue.put(None, timeout=1.0)
+            except queue.Full:
+                self._logger.debug("Hotkey event queue full; worker not signalled")
             self._worker_thread.join(timeout=1.0)
             if self._worker_thread.is_alive():
                 self._logger.warning("Hotkey worker did not exit cleanly")
@@ -3,6 +3,7 @@
 import logging
 import shutil
 import subprocess
+import threading
 import time
 from typing import Optional
 
@@ -16,15 +17,18 @@ except Exception as exc:
     _PYNPUT_AVAILABLE = False
     _PYNPUT_IMPORT_ERROR = exc
 
-from .config import Config, is_wayland
+from .config import Config, get_platform, is_wayland
 from .sounds import play_sound
 from .window import WindowInfo, restore_focus
 
 # Global keyboard controller
 _keyboard: Optional[Controller] = None
+_keyboard_lock = threading.Lock()
 _injection_capable: Optional[bool] = None
 _injection_checked_at: Optional[float] = None
 _injection_cache_ttl = 300.0
+# Time for the target app to read the clipboard before it is restored.
+_paste_restore_delay = 0.15
 _logger = logging.getLogger(__name__)
 _pynput_warned = False
 
@@ -35,7 +39,10 @@ def get_keyboard() -> Controller:
     if not _PYNPUT_AVAILABLE:
         raise RuntimeError("pynput unavailable; keyboard injection disabled")
     if _keyboard is None:
-        _keyboard = Controller()
+        # Double-checked so concurrent first callers share one controller.
+        with _keyboard_lock:
+            if _keyboard is None:
+                _keyboard = Controller()
     return _keyboard
 
 
@@ -88,8 +95,8 @@ def _output_via_wtype(text: str, config: Config) -> bool:
 def test_injection() -> bool:
     """Test if keyboard injection works.
 
-    This is a lightweight probe that presses/release a modifier key.
-    If it fails, we know injection doesn't work.
+    This is a capability check: it confirms a keyboard controller can be
+    created without sending any key events to the focused window.
 
     Returns:
         True if injection appears to work, False otherwise.
@@ -120,9 +127,7 @@ def test_injection() -> bool:
         return cache_result(False)
 
     try:
-        kb = get_keyboard()
-        kb.press(Key.shift)
-        kb.release(Key.shift)
+        get_keyboard()
         return cache_result(True)
     except Exception:
         return cache_result(False)
@@ -191,6 +196,14 @@ def _output_via_injection(
                 _logger.warning("Focus restore failed; falling back to clipboard")
                 return _output_via_clipboard(text, config)
 
+        # Long text is pasted in one shortcut instead of typed key by key
+        if config.paste_threshold and len(text) > config.paste_threshold:
+            if _output_via_paste(text):
+                if config.sound_effects:
+                    play_sound("complete")
+                return True
+            _logger.debug("Paste failed; typing text instead")
+
         # Type the text
         kb = get_keyboard()
         kb.type(text)
@@ -205,6 +218,65 @@ def _output_via_injection(
         return _output_via_clipboard(text, config)
 
 
+def _paste_modifiers() -> tuple:
+    """Modifier keys for the platform's paste shortcut."""
+    platform_name = get_platform()
+    if platform_name == "macos":
+        return (Key.cmd,)
+    if platform_name == "linux":
+        # Terminals (where Claude Code runs) treat plain ctrl+v as a literal.
+        return (Key.ctrl, Key.shift)
+    return (Key.ctrl,)
+
+
+def _output_via_paste(text: str) -> bool:
+    """Paste text through the clipboard, then restore the previous contents.
+
+    Args:
+        text: The text to paste.
+
+    Returns:
+        True if the paste shortcut was sent, False otherwise.
+    """
+    try:
+        import pyperclip
+    except ImportError:
+        return False
+
+    # No is_available() pre-check: it reports False until the first
+    # copy()/paste() call (asweigart/pyperclip#289).
+    try:
+        previous = pyperclip.paste()
+    except pyperclip.PyperclipException:
+        previous = None
+
+    try:
+        pyperclip.copy(text)
+    except pyperclip.PyperclipException:
+        _logger.debug("Clipboard unavailable for paste", exc_info=True)
+        return False
+
+    sent = False
+    try:
+        kb = get_keyboard()
+        with kb.pressed(*_paste_modifiers()):
+            kb.tap("v")
+        sent = True
+    except Exception:
+        _logger.debug("Paste shortcut failed", exc_info=True)
+    finally:
+        # pyperclip reports non-text contents (images, files) as "", and
+        # copying that back would wipe them; only restore real text.
+        if previous:
+            if sent:
+                time.sleep(_paste_restore_delay)
+            try:
+                pyperclip.copy(previous)
+            except pyperclip.PyperclipException:
+                _logger.debug("Failed to restore clipboard", exc_info=True)
+    return sent
+
+
 def _output_via_clipboard(text: str, config: Config) -> bool:
     """Output text by copying to clipboard.
 
@@ -4,9 +4,8 @@ import logging
 import math
 import queue
 import threading
-from collections import deque
 from dataclasses import dataclass
-from typing import Deque, Generator, Optional
+from typing import Generator, Optional
 
 import numpy as np
 
@@ -40,6 +39,10 @@ class AudioChunk:
     timestamp: float
 
 
+# Initial buffer length for recordings without a duration cap: 30s at 16kHz.
+_UNBOUNDED_INITIAL_FRAMES = 30 * 16000
+
+
 class AudioRecorder:
     """Records audio from the microphone.
 
@@ -56,18 +59,50 @@ class AudioRecorder:
         self._recording = False
         self._audio_queue: queue.Queue[np.ndarray] = queue.Queue()
         self._stream: Optional["sd.InputStream"] = None
-        self._recorded_chunks: Deque[np.ndarray] = deque()
-        self._max_chunks = self._compute_max_chunks()
+        # Recorded audio lands in one preallocated buffer. With a duration cap
+        # it is a ring that keeps the most recent max_frames.
+        self._buffer: Optional[np.ndarray] = None
+        self._frames_written = 0
+        self._max_frames = self._compute_max_frames()
         self._lock = threading.Lock()
         self._logger = logging.getLogger(__name__)
 
-    def _compute_max_chunks(self) -> Optional[int]:
+    def _compute_max_frames(self) -> Optional[int]:
         max_seconds = self.config.max_recording_seconds
         if not max_seconds:
             return None
         max_seconds = max(1, int(max_seconds))
         chunks = max_seconds * self.config.sample_rate / self.config.blocksize
-        return max(1, int(math.ceil(chunks)))
+        return max(1, int(math.ceil(chunks))) * self.config.blocksize
+
+    def _allocate_buffer(self) -> np.ndarray:
+        frames = self._max_frames or _UNBOUNDED_INITIAL_FRAMES
+        return np.empty((frames, self.config.channels), dtype=self.config.dtype)
+
+    def _write_frames(self, data: np.ndarray) -> None:
+        """Copy a block into the recording buffer. Caller holds the lock."""
+        buffer = self._buffer
+        frames = len(data)
+        if self._max_frames is None:
+            end = self._frames_written + frames
+            if end > len(buffer):
+                grown = np.empty((max(end, len(buffer) * 2),) + buffer.shape[1:], buffer.dtype)
+                grown[: self._frames_written] = buffer[: self._frames_written]
+                self._buffer = buffer = grown
+            buffer[self._frames_written : end] = data
+            self._frames_written = end
+            return
+
+        capacity = len(buffer)
+        if frames > capacity:
+            data = data[-capacity:]
+        # Skipped leading frames still advance the ring position.
+        start = (self._frames_written + frames - len(data)) % capacity
+        first = min(len(data), capacity - start)
+        buffer[start : start + first] = data[:first]
+        if first < len(data):
+            buffer[: len(data) - first] = data[first:]
+        self._frames_written += frames
 
     def is_available(self) -> bool:
         """Check if audio recording is available."""
@@ -113,9 +148,11 @@ class AudioRecorder:
 
         try:
             self._audio_queue = queue.Queue(maxsize=self.config.queue_maxsize)
-            self._recorded_chunks = (
-                deque(maxlen=self._max_chunks) if self._max_chunks else deque()
-            )
+            # A fresh buffer per recording: the previous one may still be
+            # referenced by a transcription in flight.
+            with self._lock:
+                self._buffer = self._allocate_buffer()
+                self._frames_written = 0
 
             def callback(indata, frames, time_info, status):
                 if status:
@@ -125,7 +162,8 @@ class AudioRecorder:
                 except queue.Full:
                     self._logger.debug("Audio queue full; dropping chunk")
                 with self._lock:
-                    self._recorded_chunks.append(indata.copy())
+                    if self._buffer is not None:
+                        self._write_frames(indata)
 
             self._stream = sd.InputStream(
                 samplerate=self.config.sample_rate,
@@ -162,13 +200,22 @@ class AudioRecorder:
         self._recording = False
 
         with self._lock:
-            if not self._recorded_chunks:
-                return None
+            buffer, frames = self._buffer, self._frames_written
+            self._buffer = None
+            self._frames_written = 0
+
+        if buffer is None or not frames:
+            return None
 
-            # Concatenate all chunks
-            audio = np.concatenate(list(self._recorded_chunks))
-            self._recorded_chunks = deque()
-            return np.squeeze(audio)
+        capacity = len(buffer)
+        if self._max_frames is not None and frames > capacity:
+            # The ring wrapped; unroll it oldest-first.
+            start = frames % capacity
+            audio = np.concatenate((buffer[start:], buffer[:start]))
+        else:
+            # A view of the buffer; no copy for the common case.
+            audio = buffer[:frames]
+        return np.squeeze(audio)
 
     def get_chunk(self, timeout: float = 0.1) -> Optional[np.ndarray]:
         """Get the next audio chunk from the recording stream.
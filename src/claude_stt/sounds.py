@@ -3,13 +3,27 @@
 import logging
 import os
 import platform
+import queue
 import shutil
 import subprocess
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Callable, Literal, Optional
+
+__all__ = [
+    "LINUX_SOUNDS",
+    "MACOS_SOUNDS",
+    "SoundEvent",
+    "WINDOWS_SOUNDS",
+    "play_sound",
+    "preload_sounds",
+]
 
 SoundEvent = Literal["start", "stop", "complete", "error", "warning"]
 _logger = logging.getLogger(__name__)
+_SYSTEM = platform.system()
 
 # macOS system sounds
 MACOS_SOUNDS = {
@@ -29,79 +43,278 @@ LINUX_SOUNDS = {
     "warning": "/usr/share/sounds/freedesktop/stereo/dialog-warning.oga",
 }
 
+# Windows system sounds
+if _SYSTEM == "Windows":
+    try:
+        import winsound
+    except ImportError:
+        winsound = None
+else:
+    winsound = None
+
+WINDOWS_SOUNDS = (
+    {
+        "start": winsound.MB_OK,
+        "stop": winsound.MB_OK,
+        "complete": winsound.MB_OK,
+        "error": winsound.MB_ICONHAND,
+        "warning": winsound.MB_ICONEXCLAMATION,
+    }
+    if winsound is not None
+    else {}
+)
+
+_AUDIO_TOOLBOX = "/System/Library/Frameworks/AudioToolbox.framework/AudioToolbox"
+_CORE_FOUNDATION = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+
+# Players are fire-and-forget: spawn them with stdio on /dev/null.
+_SPAWN_FILE_ACTIONS = (
+    [
+        (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+    ]
+    if hasattr(os, "posix_spawn")
+    else None
+)
+_spawned_pids: list[int] = []
+_spawned_procs: list[subprocess.Popen] = []
+_spawn_lock = threading.Lock()
+
+# Playback runs on one background worker; a late beep is worse than a
+# missing one, so events beyond this backlog are dropped.
+_SOUND_QUEUE_SIZE = 4
+_sound_queue: "queue.Queue[SoundEvent]" = queue.Queue(maxsize=_SOUND_QUEUE_SIZE)
+_sound_thread: Optional[threading.Thread] = None
+_sound_thread_lock = threading.Lock()
+
+
+def _coalesce_seconds() -> float:
+    raw = os.environ.get("CLAUDE_STT_SOUND_COALESCE_MS", "50")
+    try:
+        return max(float(raw), 0.0) / 1000.0
+    except ValueError:
+        _logger.debug("Invalid CLAUDE_STT_SOUND_COALESCE_MS: %r", raw)
+        return 0.05
+
+
+# Repeats of the same event inside this window (e.g. from key repeat) play once.
+_COALESCE_SECONDS = _coalesce_seconds()
+_last_played: dict[str, float] = {}
+
 
 def play_sound(event: SoundEvent) -> None:
     """Play a native system sound for the given event.
 
+    Playback happens on a background worker; this never blocks the caller.
+
     Args:
         event: The type of sound event to play.
     """
-    system = platform.system()
+    if _PLAY is None:
+        return
+
+    now = time.monotonic()
+    if now - _last_played.get(event, float("-inf")) < _COALESCE_SECONDS:
+        return
+    _last_played[event] = now
 
+    _ensure_sound_worker()
     try:
-        if system == "Darwin":
-            _play_macos_sound(event)
-        elif system == "Linux":
-            _play_linux_sound(event)
-        elif system == "Windows":
-            _play_windows_sound(event)
-    except Exception:
-        # Silently fail if sound playback doesn't work
-        pass
+        _sound_queue.put_nowait(event)
+    except queue.Full:
+        _logger.debug("Dropping sound '%s'; queue full", event)
 
 
-def _play_macos_sound(event: SoundEvent) -> None:
-    """Play sound on macOS using afplay."""
-    sound_file = MACOS_SOUNDS.get(event)
-    if not sound_file:
-        return
-    if not Path(sound_file).exists():
-        _logger.debug("Sound file missing: %s", sound_file)
+def _ensure_sound_worker() -> None:
+    global _sound_thread
+    if _sound_thread is not None and _sound_thread.is_alive():
         return
-    if shutil.which("afplay") is None:
+    with _sound_thread_lock:
+        if _sound_thread is None or not _sound_thread.is_alive():
+            _sound_thread = threading.Thread(
+                target=_sound_worker,
+                name="claude-stt-sounds",
+                daemon=True,
+            )
+            _sound_thread.start()
+
+
+def _sound_worker() -> None:
+    while True:
+        event = _sound_queue.get()
+        try:
+            _PLAY(event)
+        except Exception:
+            # Silently fail if sound playback doesn't work
+            pass
+
+
+def preload_sounds() -> None:
+    """Resolve the player and load sound data before the first event.
+
+    Otherwise the first hotkey press pays for player lookup and, on macOS,
+    registering the sounds with AudioToolbox.
+    """
+    try:
+        if _SYSTEM == "Darwin":
+            if _macos_system_sounds() is None:
+                _macos_player()
+        elif _SYSTEM == "Linux":
+            _linux_sound_files()
+            _linux_player()
+    except Exception:
+        _logger.debug("Sound preload failed", exc_info=True)
+
+
+def _existing_sound_files(sounds: dict[str, str]) -> dict[str, str]:
+    """Return the subset of sound files that exist on disk."""
+    existing = {}
+    for event, sound_file in sounds.items():
+        if os.path.isfile(sound_file):
+            existing[event] = sound_file
+        else:
+            _logger.debug("Sound file missing: %s", sound_file)
+    return existing
+
+
+@lru_cache(maxsize=1)
+def _macos_sound_files() -> dict[str, str]:
+    return _existing_sound_files(MACOS_SOUNDS)
+
+
+@lru_cache(maxsize=1)
+def _linux_sound_files() -> dict[str, str]:
+    return _existing_sound_files(LINUX_SOUNDS)
+
+
+@lru_cache(maxsize=1)
+def _macos_player() -> Optional[tuple[str, ...]]:
+    afplay = shutil.which("afplay")
+    if afplay is None:
         _logger.debug("afplay not available")
-        return
-    subprocess.Popen(
-        ["afplay", sound_file],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
+        return None
+    return (afplay,)
 
 
-def _play_linux_sound(event: SoundEvent) -> None:
-    """Play sound on Linux using pw-play, paplay, or aplay."""
-    sound_file = LINUX_SOUNDS.get(event)
-    if not sound_file:
-        return
-    if not Path(sound_file).exists():
-        _logger.debug("Sound file missing: %s", sound_file)
-        return
+@lru_cache(maxsize=1)
+def _macos_system_sounds() -> Optional[tuple[Callable[[int], None], dict[str, int]]]:
+    """Register the macOS sounds with AudioToolbox.
 
-    # Try pw-play first (PipeWire native) when the PipeWire socket is present
-    if shutil.which("pw-play") and _pipewire_socket_available():
-        subprocess.Popen(
-            ["pw-play", sound_file],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-        return
+    Returns the AudioServicesPlaySystemSound function and a SystemSoundID per
+    event, or None when the frameworks cannot be loaded.
+    """
+    try:
+        import ctypes
+
+        toolbox = ctypes.CDLL(_AUDIO_TOOLBOX)
+        core_foundation = ctypes.CDLL(_CORE_FOUNDATION)
+    except OSError:
+        _logger.debug("AudioToolbox not available", exc_info=True)
+        return None
+
+    create_url = core_foundation.CFURLCreateFromFileSystemRepresentation
+    create_url.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_long, ctypes.c_bool]
+    create_url.restype = ctypes.c_void_p
+    release = core_foundation.CFRelease
+    release.argtypes = [ctypes.c_void_p]
+    release.restype = None
+    create_sound = toolbox.AudioServicesCreateSystemSoundID
+    create_sound.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32)]
+    create_sound.restype = ctypes.c_int32
+    play = toolbox.AudioServicesPlaySystemSound
+    play.argtypes = [ctypes.c_uint32]
+    play.restype = None
+
+    sound_ids: dict[str, int] = {}
+    for event, sound_file in _macos_sound_files().items():
+        raw_path = os.fsencode(sound_file)
+        url = create_url(None, raw_path, len(raw_path), False)
+        if not url:
+            continue
+        sound_id = ctypes.c_uint32()
+        try:
+            status = create_sound(url, ctypes.byref(sound_id))
+        finally:
+            release(url)
+        if status == 0:
+            sound_ids[event] = sound_id.value
+        else:
+            _logger.debug("AudioServicesCreateSystemSoundID failed (%d): %s", status, sound_file)
+
+    if not sound_ids:
+        return None
+    return play, sound_ids
 
-    # Try paplay (PulseAudio)
-    if shutil.which("paplay"):
-        subprocess.Popen(
-            ["paplay", sound_file],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-        return
+
+@lru_cache(maxsize=1)
+def _linux_player() -> Optional[tuple[str, ...]]:
+    """Resolve the Linux player argv prefix: pw-play, paplay, then aplay."""
+    # Prefer pw-play (PipeWire native) when the PipeWire socket is present
+    pw_play = shutil.which("pw-play")
+    if pw_play and _pipewire_socket_available():
+        return (pw_play,)
+
+    # Then paplay (PulseAudio)
+    paplay = shutil.which("paplay")
+    if paplay:
+        return (paplay,)
 
     # Fall back to aplay (ALSA) - note: may not support .oga files
-    if shutil.which("aplay"):
-        subprocess.Popen(
-            ["aplay", "-q", sound_file],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+    aplay = shutil.which("aplay")
+    if aplay:
+        return (aplay, "-q")
+
+    _logger.debug("No sound player available")
+    return None
+
+
+def _spawn_player(player: Optional[tuple[str, ...]], sound_file: Optional[str]) -> None:
+    if player is None or sound_file is None:
+        return
+    argv = [*player, sound_file]
+    with _spawn_lock:
+        _reap_players()
+        if _SPAWN_FILE_ACTIONS is None:
+            proc = subprocess.Popen(
+                argv,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            _spawned_procs.append(proc)
+            return
+        pid = os.posix_spawn(argv[0], argv, os.environ, file_actions=_SPAWN_FILE_ACTIONS)
+        _spawned_pids.append(pid)
+
+
+def _reap_players() -> None:
+    """Collect exited players so they do not linger as zombies."""
+    for pid in list(_spawned_pids):
+        try:
+            done, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            done = pid
+        if done:
+            _spawned_pids.remove(pid)
+    _spawned_procs[:] = [proc for proc in _spawned_procs if proc.poll() is None]
+
+
+def _play_macos_sound(event: SoundEvent) -> None:
+    """Play sound on macOS via AudioToolbox, falling back to afplay."""
+    system_sounds = _macos_system_sounds()
+    if system_sounds is not None:
+        play, sound_ids = system_sounds
+        sound_id = sound_ids.get(event)
+        if sound_id is not None:
+            play(sound_id)
+            return
+    _spawn_player(_macos_player(), _macos_sound_files().get(event))
+
+
+def _play_linux_sound(event: SoundEvent) -> None:
+    """Play sound on Linux using pw-play, paplay, or aplay."""
+    _spawn_player(_linux_player(), _linux_sound_files().get(event))
 
 
 def _pipewire_socket_available() -> bool:
@@ -117,19 +330,15 @@ def _pipewire_socket_available() -> bool:
 
 def _play_windows_sound(event: SoundEvent) -> None:
     """Play sound on Windows using winsound."""
-    try:
-        import winsound
-
-        # Map events to Windows system sounds
-        sound_map = {
-            "start": winsound.MB_OK,
-            "stop": winsound.MB_OK,
-            "complete": winsound.MB_OK,
-            "error": winsound.MB_ICONHAND,
-            "warning": winsound.MB_ICONEXCLAMATION,
-        }
-
-        sound_type = sound_map.get(event, winsound.MB_OK)
-        winsound.MessageBeep(sound_type)
-    except ImportError:
+    if winsound is None:
         _logger.debug("winsound not available")
+        return
+    winsound.MessageBeep(WINDOWS_SOUNDS.get(event, winsound.MB_OK))
+
+
+# Resolved once: the platform cannot change while the process runs.
+_PLAY = {
+    "Darwin": _play_macos_sound,
+    "Linux": _play_linux_sound,
+    "Windows": _play_windows_sound,
+}.get(_SYSTEM)
@@ -1,22 +1,107 @@
 """Cross-platform window focus tracking and restoration."""
 
+import json
 import logging
+import os
 import platform
+import select
+import shutil
 import subprocess
+import threading
 import time
-from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, NamedTuple, Optional, Union
 
 from .config import is_wayland
 
+__all__ = ["WindowInfo", "get_active_window", "restore_focus"]
+
+_SYSTEM = platform.system()
+
+# Upper bound on waiting for a restored window to become active.
+_FOCUS_SETTLE_TIMEOUT = 0.1
+_FOCUS_POLL_INTERVAL = 0.01
+
+# Long-lived osascript helper: reads one JSON-encoded AppleScript source per
+# line on stdin, runs it with NSAppleScript and answers with one JSON line.
+_APPLESCRIPT_SERVER = r"""
+ObjC.import("Foundation");
+function run() {
+    const input = $.NSFileHandle.fileHandleWithStandardInput;
+    const output = $.NSFileHandle.fileHandleWithStandardOutput;
+    let pending = "";
+    while (true) {
+        const data = input.availableData;
+        if (data.length === 0) {
+            return;
+        }
+        pending += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+        let newline;
+        while ((newline = pending.indexOf("\n")) >= 0) {
+            const source = JSON.parse(pending.slice(0, newline));
+            pending = pending.slice(newline + 1);
+            const error = Ref();
+            const result = $.NSAppleScript.alloc.initWithSource(source).executeAndReturnError(error);
+            let reply;
+            if (result.isNil()) {
+                const info = ObjC.deepUnwrap(error[0]) || {};
+                reply = {ok: false, error: String(info.NSAppleScriptErrorMessage || "")};
+            } else {
+                reply = {ok: true, output: ObjC.unwrap(result.stringValue) || ""};
+            }
+            output.writeData($(JSON.stringify(reply) + "\n").dataUsingEncoding($.NSUTF8StringEncoding));
+        }
+    }
+}
+"""
+
+_CORE_FOUNDATION = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+_CORE_GRAPHICS = "/System/Library/Frameworks/CoreGraphics.framework/CoreGraphics"
+_APPLICATION_SERVICES = (
+    "/System/Library/Frameworks/ApplicationServices.framework/ApplicationServices"
+)
+_kCFStringEncodingUTF8 = 0x08000100
+_kCFNumberSInt64Type = 4
+_kCGWindowListOptionOnScreenOnly = 1 << 0
+_kCGWindowListExcludeDesktopElements = 1 << 4
+
+_applescript_server: Optional[subprocess.Popen] = None
+_applescript_lock = threading.Lock()
+
+_xlib_lock = threading.Lock()
+
+# user32 entry points, bound once with prototypes. HWND is pointer-sized, so
+# the default int restype would truncate handles on 64-bit Windows.
+if _SYSTEM == "Windows":
+    import ctypes
+    from ctypes import wintypes
+
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+
+    def _user32_function(name, argtypes, restype=wintypes.BOOL):
+        function = getattr(_user32, name)
+        function.argtypes = argtypes
+        function.restype = restype
+        return function
+
+    _GetForegroundWindow = _user32_function("GetForegroundWindow", [], wintypes.HWND)
+    _SetForegroundWindow = _user32_function("SetForegroundWindow", [wintypes.HWND])
+    _ShowWindow = _user32_function("ShowWindow", [wintypes.HWND, ctypes.c_int])
+    _IsWindow = _user32_function("IsWindow", [wintypes.HWND])
+    _IsIconic = _user32_function("IsIconic", [wintypes.HWND])
+    _IsZoomed = _user32_function("IsZoomed", [wintypes.HWND])
+
+
+class WindowInfo(NamedTuple):
+    """Information about a captured window.
+
+    window_id is the native HWND (an int) on Windows and a string elsewhere.
+    """
 
-@dataclass
-class WindowInfo:
-    """Information about a captured window."""
-
-    window_id: str
+    window_id: Union[int, str]
     platform: str
     app_name: Optional[str] = None
+    pid: Optional[int] = None
 
 
 def get_active_window() -> Optional[WindowInfo]:
@@ -25,15 +110,11 @@ def get_active_window() -> Optional[WindowInfo]:
     Returns:
         WindowInfo with the window identifier, or None if unable to capture.
     """
-    system = platform.system()
+    if _GET_WINDOW is None:
+        return None
 
     try:
-        if system == "Darwin":
-            return _get_macos_window()
-        elif system == "Linux":
-            return _get_linux_window()
-        elif system == "Windows":
-            return _get_windows_window()
+        return _GET_WINDOW()
     except Exception:
         logging.getLogger(__name__).debug("Failed to capture active window", exc_info=True)
 
@@ -51,24 +132,89 @@ def restore_focus(window_info: Optional[WindowInfo]) -> bool:
     """
     if window_info is None:
         return False
-    if not window_info.window_id and not window_info.app_name:
+    if not window_info.window_id and not window_info.app_name and window_info.pid is None:
+        return False
+
+    restore = _RESTORE_FOCUS.get(window_info.platform)
+    if restore is None:
         return False
 
     try:
-        if window_info.platform == "Darwin":
-            return _restore_macos_focus(window_info)
-        elif window_info.platform == "Linux":
-            return _restore_linux_focus(window_info)
-        elif window_info.platform == "Windows":
-            return _restore_windows_focus(window_info)
+        # Typing back into the window that is still active needs no restore.
+        # Without a window id, equality would only mean "same app is active".
+        if (
+            window_info.window_id
+            and window_info.platform == _SYSTEM
+            and _active_window_is_cheap()
+            and get_active_window() == window_info
+        ):
+            return True
+        return restore(window_info)
     except Exception:
         logging.getLogger(__name__).debug("Failed to restore focus", exc_info=True)
 
     return False
 
 
+@lru_cache(maxsize=1)
+def _appkit():
+    """Import AppKit (pyobjc) on first use, or return None if unavailable."""
+    try:
+        import AppKit
+    except ImportError:
+        logging.getLogger(__name__).debug("AppKit not available; using AppleScript")
+        return None
+    return AppKit
+
+
+def _active_window_is_cheap() -> bool:
+    """Whether get_active_window() uses a native API rather than a subprocess."""
+    if _SYSTEM == "Darwin":
+        # Capture needs AppKit for the app and CoreGraphics for the window id;
+        # otherwise it runs AppleScript.
+        return _appkit() is not None and _macos_window_api() is not None
+    if _SYSTEM == "Linux":
+        return not is_wayland() and _xlib_connection() is not None
+    return _SYSTEM == "Windows"
+
+
+def _wait_for_focus(is_focused: Callable[[], bool]) -> bool:
+    """Poll until focus has landed, bounded by _FOCUS_SETTLE_TIMEOUT."""
+    deadline = time.monotonic() + _FOCUS_SETTLE_TIMEOUT
+    while not is_focused():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(_FOCUS_POLL_INTERVAL)
+    return True
+
+
+def _macos_active_app(appkit) -> Optional[tuple[int, str]]:
+    # frontmostApplication and NSRunningApplication state only refresh while
+    # the main run loop runs, which the daemon never does; activeApplication()
+    # is queried on every call.
+    info = appkit.NSWorkspace.sharedWorkspace().activeApplication()
+    if not info:
+        return None
+    pid = info.get("NSApplicationProcessIdentifier")
+    if pid is None:
+        return None
+    return int(pid), str(info.get("NSApplicationName") or "")
+
+
 def _get_macos_window() -> Optional[WindowInfo]:
-    """Get active window on macOS using AppleScript."""
+    """Get active window on macOS using NSWorkspace, falling back to AppleScript."""
+    appkit = _appkit()
+    if appkit is not None:
+        active = _macos_active_app(appkit)
+        if active is not None:
+            pid, app_name = active
+            return WindowInfo(
+                window_id=_macos_front_window_id(pid),
+                platform="Darwin",
+                app_name=app_name,
+                pid=pid,
+            )
+
     script = '''
     tell application "System Events"
         set frontApp to first application process whose frontmost is true
@@ -82,38 +228,197 @@ def _get_macos_window() -> Optional[WindowInfo]:
     end tell
     '''
 
-    result = subprocess.run(
-        ["osascript", "-e", script],
-        capture_output=True,
-        text=True,
-        timeout=2,
-    )
+    ok, output = _run_applescript(script)
 
-    if result.returncode == 0:
-        lines = [line for line in result.stdout.splitlines() if line.strip()]
+    if ok:
+        lines = [line for line in output.splitlines() if line.strip()]
         app_name = lines[0].strip() if lines else None
         window_id = lines[1].strip() if len(lines) > 1 else ""
         if app_name:
             return WindowInfo(window_id=window_id, platform="Darwin", app_name=app_name)
 
-    logging.getLogger(__name__).debug(
-        "osascript get window failed: %s", result.stderr.strip()
-    )
+    logging.getLogger(__name__).debug("osascript get window failed: %s", output)
     return None
 
 
+@lru_cache(maxsize=1)
+def _macos_window_api():
+    """Bind the CoreGraphics and Accessibility calls used for window ids.
+
+    Returns None when the frameworks (or the _AXUIElementGetWindow symbol
+    that maps an AX window to its window number) are unavailable.
+    """
+    try:
+        import ctypes
+        from types import SimpleNamespace
+
+        core_foundation = ctypes.CDLL(_CORE_FOUNDATION)
+        core_graphics = ctypes.CDLL(_CORE_GRAPHICS)
+        services = ctypes.CDLL(_APPLICATION_SERVICES)
+
+        def bind(library, name, argtypes, restype):
+            function = getattr(library, name)
+            function.argtypes = argtypes
+            function.restype = restype
+            return function
+
+        ref = ctypes.c_void_p
+        api = SimpleNamespace(
+            release=bind(core_foundation, "CFRelease", [ref], None),
+            array_count=bind(core_foundation, "CFArrayGetCount", [ref], ctypes.c_long),
+            array_item=bind(
+                core_foundation, "CFArrayGetValueAtIndex", [ref, ctypes.c_long], ref
+            ),
+            dict_value=bind(core_foundation, "CFDictionaryGetValue", [ref, ref], ref),
+            number_value=bind(
+                core_foundation, "CFNumberGetValue", [ref, ctypes.c_int, ref], ctypes.c_bool
+            ),
+            window_list=bind(
+                core_graphics,
+                "CGWindowListCopyWindowInfo",
+                [ctypes.c_uint32, ctypes.c_uint32],
+                ref,
+            ),
+            app_element=bind(services, "AXUIElementCreateApplication", [ctypes.c_int], ref),
+            copy_attribute=bind(
+                services,
+                "AXUIElementCopyAttributeValue",
+                [ref, ref, ctypes.POINTER(ref)],
+                ctypes.c_int32,
+            ),
+            perform_action=bind(
+                services, "AXUIElementPerformAction", [ref, ref], ctypes.c_int32
+            ),
+            element_window=bind(
+                services,
+                "_AXUIElementGetWindow",
+                [ref, ctypes.POINTER(ctypes.c_uint32)],
+                ctypes.c_int32,
+            ),
+            owner_pid_key=ref.in_dll(core_graphics, "kCGWindowOwnerPID").value,
+            layer_key=ref.in_dll(core_graphics, "kCGWindowLayer").value,
+            number_key=ref.in_dll(core_graphics, "kCGWindowNumber").value,
+        )
+        create_string = bind(
+            core_foundation,
+            "CFStringCreateWithCString",
+            [ref, ctypes.c_char_p, ctypes.c_uint32],
+            ref,
+        )
+        # Created once and kept for the life of the process.
+        api.windows_attribute = create_string(None, b"AXWindows", _kCFStringEncodingUTF8)
+        api.raise_action = create_string(None, b"AXRaise", _kCFStringEncodingUTF8)
+    except (OSError, AttributeError, ValueError):
+        logging.getLogger(__name__).debug("macOS window APIs not available", exc_info=True)
+        return None
+    return api
+
+
+def _cf_int(api, number) -> Optional[int]:
+    import ctypes
+
+    value = ctypes.c_int64()
+    if number and api.number_value(number, _kCFNumberSInt64Type, ctypes.byref(value)):
+        return value.value
+    return None
+
+
+def _macos_front_window_id(pid: int) -> str:
+    """Window number of the front normal window of a process, or "".
+
+    CGWindowListCopyWindowInfo lists on-screen windows front to back, so the
+    first layer-0 window owned by the process is its front window.
+    """
+    api = _macos_window_api()
+    if api is None:
+        return ""
+    windows = api.window_list(
+        _kCGWindowListOptionOnScreenOnly | _kCGWindowListExcludeDesktopElements, 0
+    )
+    if not windows:
+        return ""
+    try:
+        for index in range(api.array_count(windows)):
+            info = api.array_item(windows, index)
+            if _cf_int(api, api.dict_value(info, api.owner_pid_key)) != pid:
+                continue
+            if _cf_int(api, api.dict_value(info, api.layer_key)) != 0:
+                continue
+            number = _cf_int(api, api.dict_value(info, api.number_key))
+            return str(number) if number else ""
+    finally:
+        api.release(windows)
+    return ""
+
+
+def _raise_macos_window(pid: int, window_id: int) -> bool:
+    """Raise one window of a process through the Accessibility API."""
+    import ctypes
+
+    api = _macos_window_api()
+    if api is None:
+        return False
+    app = api.app_element(pid)
+    if not app:
+        return False
+    try:
+        windows = ctypes.c_void_p()
+        if api.copy_attribute(app, api.windows_attribute, ctypes.byref(windows)) != 0:
+            return False
+        if not windows.value:
+            return False
+        try:
+            number = ctypes.c_uint32()
+            for index in range(api.array_count(windows)):
+                element = api.array_item(windows, index)
+                if api.element_window(element, ctypes.byref(number)) != 0:
+                    continue
+                if number.value == window_id:
+                    return api.perform_action(element, api.raise_action) == 0
+        finally:
+            api.release(windows)
+    finally:
+        api.release(app)
+    return False
+
+
 def _escape_applescript_string(value: str) -> str:
     return value.replace("\\", "\\\\").replace('"', '\\"')
 
 
 def _restore_macos_focus(window_info: WindowInfo) -> bool:
-    """Restore focus on macOS using AppleScript."""
-    app_name = _escape_applescript_string(window_info.app_name or "")
+    """Restore focus on macOS using NSRunningApplication, falling back to AppleScript."""
     try:
         window_id = int(window_info.window_id) if window_info.window_id else None
     except (TypeError, ValueError):
         window_id = None
 
+    appkit = _appkit()
+    if appkit is not None and window_info.pid is not None:
+        app = appkit.NSRunningApplication.runningApplicationWithProcessIdentifier_(
+            window_info.pid
+        )
+        if app is not None and app.activateWithOptions_(
+            appkit.NSApplicationActivateIgnoringOtherApps
+        ):
+            # Activation fronts the app's last key window; raise the exact
+            # window dictation started from when the app has several.
+            if window_id:
+                _raise_macos_window(window_info.pid, window_id)
+
+            def is_frontmost() -> bool:
+                active = _macos_active_app(appkit)
+                return active is not None and active[0] == window_info.pid
+
+            _wait_for_focus(is_frontmost)
+            return True
+
+    app_name = _escape_applescript_string(window_info.app_name or "")
+    if window_info.pid is not None:
+        # Natively captured ids are window numbers, which System Events
+        # does not know; fall back to activating the app by name.
+        window_id = None
+
     if app_name and window_id:
         script = f'''
         tell application "System Events"
@@ -142,80 +447,262 @@ def _restore_macos_focus(window_info: WindowInfo) -> bool:
     else:
         return False
 
+    ok, output = _run_applescript(script)
+
+    if ok:
+        time.sleep(0.1)  # Allow focus to settle
+        return True
+
+    logging.getLogger(__name__).debug("osascript restore focus failed: %s", output)
+    return False
+
+
+def _run_applescript(script: str, timeout: float = 2.0) -> tuple[bool, str]:
+    """Run an AppleScript, returning (success, output or error message).
+
+    Scripts go to a persistent osascript helper so each call avoids starting
+    a new interpreter; a one-shot osascript is used if the helper fails.
+    """
+    with _applescript_lock:
+        try:
+            return _ask_applescript_server(script, timeout)
+        except (OSError, ValueError, TimeoutError):
+            logging.getLogger(__name__).debug("osascript helper failed", exc_info=True)
+            _close_applescript_server()
+
     result = subprocess.run(
         ["osascript", "-e", script],
+        stdin=subprocess.DEVNULL,
         capture_output=True,
         text=True,
-        timeout=2,
+        timeout=timeout,
     )
-
     if result.returncode == 0:
-        time.sleep(0.1)  # Allow focus to settle
-        return True
-
-    logging.getLogger(__name__).debug(
-        "osascript restore focus failed: %s", result.stderr
-    )
-    return False
+        return True, result.stdout
+    return False, result.stderr.strip()
+
+
+def _ask_applescript_server(script: str, timeout: float) -> tuple[bool, str]:
+    global _applescript_server
+    server = _applescript_server
+    if server is None or server.poll() is not None:
+        server = subprocess.Popen(
+            ["osascript", "-l", "JavaScript", "-e", _APPLESCRIPT_SERVER],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        _applescript_server = server
+
+    server.stdin.write(json.dumps(script).encode("ascii") + b"\n")
+    server.stdin.flush()
+
+    # Read the reply straight from the pipe so the timeout can be honoured.
+    fd = server.stdout.fileno()
+    deadline = time.monotonic() + timeout
+    reply = b""
+    while not reply.endswith(b"\n"):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+            raise TimeoutError("osascript helper did not reply")
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            raise OSError("osascript helper exited")
+        reply += chunk
+
+    data = json.loads(reply)
+    if data.get("ok"):
+        return True, data.get("output", "")
+    return False, data.get("error", "")
+
+
+def _close_applescript_server() -> None:
+    global _applescript_server
+    server = _applescript_server
+    _applescript_server = None
+    if server is None:
+        return
+    try:
+        server.kill()
+        server.wait(timeout=1)
+    except Exception:
+        pass
 
 
 def _get_linux_window() -> Optional[WindowInfo]:
-    """Get active window on Linux using xdotool."""
+    """Get active window on Linux using Xlib, falling back to xdotool."""
     if is_wayland():
         logging.getLogger(__name__).debug("Wayland session; skipping xdotool window check")
         return None
-    try:
-        result = subprocess.run(
-            ["xdotool", "getactivewindow"],
-            capture_output=True,
-            text=True,
-            timeout=2,
-        )
 
-        if result.returncode == 0:
-            window_id = result.stdout.strip()
-            return WindowInfo(window_id=window_id, platform="Linux")
-    except FileNotFoundError:
-        # xdotool not installed
-        logging.getLogger(__name__).debug("xdotool not installed")
-        pass
+    connection = _xlib_connection()
+    if connection is not None:
+        try:
+            return _get_xlib_window(connection)
+        except Exception:
+            logging.getLogger(__name__).debug("Xlib window check failed", exc_info=True)
+            _drop_xlib_connection(connection)
+
+    xdotool = _xdotool_path()
+    if xdotool is None:
+        return None
+
+    result = subprocess.run(
+        [xdotool, "getactivewindow"],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=2,
+    )
+
+    if result.returncode == 0:
+        window_id = result.stdout.strip()
+        return WindowInfo(window_id=window_id, platform="Linux")
 
     return None
 
 
 def _restore_linux_focus(window_info: WindowInfo) -> bool:
-    """Restore focus on Linux using xdotool."""
+    """Restore focus on Linux using Xlib, falling back to xdotool."""
     if is_wayland():
         logging.getLogger(__name__).debug("Wayland session; skipping xdotool focus restore")
         return False
-    try:
-        result = subprocess.run(
-            ["xdotool", "windowactivate", window_info.window_id],
-            capture_output=True,
-            text=True,
-            timeout=2,
-        )
 
-        if result.returncode == 0:
-            time.sleep(0.1)  # Allow focus to settle
-            return True
-    except FileNotFoundError:
-        logging.getLogger(__name__).debug("xdotool not installed")
-        pass
+    connection = _xlib_connection()
+    if connection is not None:
+        try:
+            return _activate_xlib_window(connection, int(window_info.window_id))
+        except ValueError:
+            return False
+        except Exception:
+            logging.getLogger(__name__).debug("Xlib focus restore failed", exc_info=True)
+            _drop_xlib_connection(connection)
+
+    xdotool = _xdotool_path()
+    if xdotool is None:
+        return False
+
+    result = subprocess.run(
+        [xdotool, "windowactivate", window_info.window_id],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=2,
+    )
+
+    if result.returncode == 0:
+        time.sleep(0.1)  # Allow focus to settle
+        return True
 
     return False
 
 
+@lru_cache(maxsize=1)
+def _xlib_connection():
+    """Open the X display once, returning (display, root, _NET_ACTIVE_WINDOW) or None."""
+    try:
+        from Xlib import display as xdisplay
+
+        x_display = xdisplay.Display()
+    except Exception:
+        logging.getLogger(__name__).debug("Xlib display not available", exc_info=True)
+        return None
+    return x_display, x_display.screen().root, x_display.intern_atom("_NET_ACTIVE_WINDOW")
+
+
+def _read_xlib_active_window(connection) -> Optional[int]:
+    from Xlib import X
+
+    _, root, active_window = connection
+    prop = root.get_full_property(active_window, X.AnyPropertyType)
+    if prop is None or not len(prop.value) or not prop.value[0]:
+        return None
+    return int(prop.value[0])
+
+
+def _drop_xlib_connection(connection) -> None:
+    """Close a failed display so the next call opens a fresh one."""
+    try:
+        connection[0].close()
+    except Exception:
+        logging.getLogger(__name__).debug("Failed to close X display", exc_info=True)
+    _xlib_connection.cache_clear()
+
+
+def _get_xlib_window(connection) -> Optional[WindowInfo]:
+    with _xlib_lock:
+        window_id = _read_xlib_active_window(connection)
+    if window_id is None:
+        return None
+    return WindowInfo(window_id=str(window_id), platform="Linux")
+
+
+def _activate_xlib_window(connection, window_id: int) -> bool:
+    """Ask the window manager to activate a window (as xdotool windowactivate does).
+
+    Returns True once _NET_ACTIVE_WINDOW reports the window, False if that
+    does not happen within _FOCUS_SETTLE_TIMEOUT.
+    """
+    from Xlib import X
+    from Xlib.protocol import event
+
+    x_display, root, active_window = connection
+    with _xlib_lock:
+        # Listen for root property changes only while waiting, so events do
+        # not pile up on the connection between restores.
+        root.change_attributes(event_mask=X.PropertyChangeMask)
+        try:
+            window = x_display.create_resource_object("window", window_id)
+            # Source indication 2 marks the request as coming from a pager, which
+            # window managers honour without focus-stealing prevention.
+            message = event.ClientMessage(
+                window=window,
+                client_type=active_window,
+                data=(32, [2, X.CurrentTime, 0, 0, 0]),
+            )
+            root.send_event(
+                message,
+                event_mask=X.SubstructureRedirectMask | X.SubstructureNotifyMask,
+            )
+            x_display.flush()
+            return _wait_for_xlib_active_window(connection, window_id)
+        finally:
+            root.change_attributes(event_mask=X.NoEventMask)
+            x_display.flush()
+
+
+def _wait_for_xlib_active_window(connection, window_id: int) -> bool:
+    from Xlib import X
+
+    x_display, _, active_window = connection
+    deadline = time.monotonic() + _FOCUS_SETTLE_TIMEOUT
+    while True:
+        while x_display.pending_events():
+            notify = x_display.next_event()
+            if notify.type == X.PropertyNotify and notify.atom == active_window:
+                if _read_xlib_active_window(connection) == window_id:
+                    return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        select.select([x_display.fileno()], [], [], remaining)
+
+
+@lru_cache(maxsize=1)
+def _xdotool_path() -> Optional[str]:
+    path = shutil.which("xdotool")
+    if path is None:
+        logging.getLogger(__name__).debug("xdotool not installed")
+    return path
+
+
 def _get_windows_window() -> Optional[WindowInfo]:
     """Get active window on Windows using ctypes."""
     try:
-        import ctypes
-
-        user32 = ctypes.windll.user32
-        hwnd = user32.GetForegroundWindow()
+        hwnd = _GetForegroundWindow()
 
         if hwnd:
-            return WindowInfo(window_id=str(hwnd), platform="Windows")
+            return WindowInfo(window_id=hwnd, platform="Windows")
     except Exception:
         pass
 
@@ -225,12 +712,9 @@ def _get_windows_window() -> Optional[WindowInfo]:
 def _restore_windows_focus(window_info: WindowInfo) -> bool:
     """Restore focus on Windows using ctypes."""
     try:
-        import ctypes
-
-        user32 = ctypes.windll.user32
-        hwnd = int(window_info.window_id)
+        hwnd = window_info.window_id
 
-        if not user32.IsWindow(hwnd):
+        if not _IsWindow(hwnd):
             return False
 
         # Show and activate the window
@@ -238,20 +722,34 @@ def _restore_windows_focus(window_info: WindowInfo) -> bool:
         SW_SHOWMAXIMIZED = 3
         SW_RESTORE = 9
 
-        if user32.IsIconic(hwnd):
+        if _IsIconic(hwnd):
             show_flag = SW_RESTORE
-        elif user32.IsZoomed(hwnd):
+        elif _IsZoomed(hwnd):
             show_flag = SW_SHOWMAXIMIZED
         else:
             show_flag = SW_SHOW
 
-        user32.ShowWindow(hwnd, show_flag)
-        if not user32.SetForegroundWindow(hwnd):
+        _ShowWindow(hwnd, show_flag)
+        if not _SetForegroundWindow(hwnd):
             return False
 
-        time.sleep(0.1)  # Allow focus to settle
+        _wait_for_focus(lambda: _GetForegroundWindow() == hwnd)
         return True
     except Exception:
         pass
 
     return False
+
+
+_RESTORE_FOCUS = {
+    "Darwin": _restore_macos_focus,
+    "Linux": _restore_linux_focus,
+    "Windows": _restore_windows_focus,
+}
+
+# Resolved once: the platform cannot change while the process runs.
+_GET_WINDOW = {
+    "Darwin": _get_macos_window,
+    "Linux": _get_linux_window,
+    "Windows": _get_windows_window,
+}.get(_SYSTEM)
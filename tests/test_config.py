@@ -1,5 +1,8 @@
+import os
+import tempfile
 import unittest
 
+from claude_stt import config as config_module
 from claude_stt.config import Config
 
 
@@ -10,6 +13,7 @@ class ConfigTests(unittest.TestCase):
             engine="nope",
             output_mode="wat",
             moonshine_model="moonshine/huge",
+            moonshine_precision="int4",
             max_recording_seconds=0,
             sample_rate=8000,
         ).validate()
@@ -18,9 +22,30 @@ class ConfigTests(unittest.TestCase):
         self.assertEqual(config.engine, "moonshine")
         self.assertEqual(config.output_mode, "auto")
         self.assertEqual(config.moonshine_model, "moonshine/huge")
+        self.assertEqual(config.moonshine_precision, "float")
         self.assertEqual(config.max_recording_seconds, 1)
         self.assertEqual(config.sample_rate, 16000)
 
+    def test_load_reuses_cache_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.environ["CLAUDE_STT_CONFIG_DIR"] = temp_dir
+            try:
+                config_path = Config.get_config_path()
+                config_path.write_text('[claude-stt]\nhotkey = "ctrl+alt+r"\n')
+                first = Config.load()
+                self.assertEqual(first.hotkey, "ctrl+alt+r")
+                self.assertIsNotNone(config_module._CONFIG_CACHE)
+
+                # Mutating a loaded config must not leak into later loads.
+                first.hotkey = "mutated"
+                self.assertEqual(Config.load().hotkey, "ctrl+alt+r")
+
+                config_path.write_text('[claude-stt]\nhotkey = "ctrl+alt+shift+t"\n')
+                self.assertEqual(Config.load().hotkey, "ctrl+alt+shift+t")
+            finally:
+                os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
+                config_module._CONFIG_CACHE = None
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -10,7 +10,7 @@ class DaemonPidTests(unittest.TestCase):
         with tempfile.TemporaryDirectory() as temp_dir:
             os.environ["CLAUDE_STT_CONFIG_DIR"] = temp_dir
             try:
-                daemon._write_pid_file(os.getpid())
+                self.assertTrue(daemon._claim_pid_file(os.getpid()))
                 data = daemon._read_pid_file()
                 self.assertIsNotNone(data)
                 self.assertEqual(data["pid"], os.getpid())
@@ -37,7 +37,7 @@ class DaemonPidTests(unittest.TestCase):
             os.environ["CLAUDE_STT_CONFIG_DIR"] = temp_dir
             original_get_process_command = daemon._get_process_command
             try:
-                daemon._write_pid_file(os.getpid())
+                self.assertTrue(daemon._claim_pid_file(os.getpid()))
                 daemon._get_process_command = lambda pid: "python other-process"
                 self.assertFalse(daemon.is_daemon_running())
                 self.assertFalse(daemon.get_pid_file().exists())
@@ -45,6 +45,57 @@ class DaemonPidTests(unittest.TestCase):
                 daemon._get_process_command = original_get_process_command
                 os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
 
+    def test_claim_pid_file_is_exclusive(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.environ["CLAUDE_STT_CONFIG_DIR"] = temp_dir
+            original_get_process_command = daemon._get_process_command
+            try:
+                daemon._get_process_command = lambda pid: "python -m claude_stt.daemon run"
+                self.assertTrue(daemon._claim_pid_file(os.getpid()))
+                self.assertFalse(daemon._claim_pid_file(os.getpid()))
+
+                # A stale file from another process is replaced.
+                daemon._get_process_command = lambda pid: "python other-process"
+                self.assertTrue(daemon._claim_pid_file(os.getpid()))
+                self.assertEqual(daemon._read_pid_file()["pid"], os.getpid())
+            finally:
+                daemon._get_process_command = original_get_process_command
+                os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
+
+    def test_claim_replaces_empty_or_garbage_pid_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.environ["CLAUDE_STT_CONFIG_DIR"] = temp_dir
+            try:
+                pid_path = daemon.get_pid_file()
+                pid_path.parent.mkdir(parents=True, exist_ok=True)
+                for content in ("", "garbage"):
+                    pid_path.write_text(content)
+                    # Older than the grace period for a concurrent writer.
+                    old = pid_path.stat().st_mtime - daemon._PID_FILE_WRITE_GRACE - 1
+                    os.utime(pid_path, (old, old))
+                    with self.assertLogs("claude_stt.daemon", level="WARNING"):
+                        self.assertTrue(daemon._claim_pid_file(12345))
+                    self.assertEqual(daemon._read_pid_file()["pid"], 12345)
+                    pid_path.unlink()
+            finally:
+                os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
+
+    def test_claim_waits_for_fresh_pid_file_to_be_written(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.environ["CLAUDE_STT_CONFIG_DIR"] = temp_dir
+            original_grace = daemon._PID_FILE_WRITE_GRACE
+            try:
+                daemon._PID_FILE_WRITE_GRACE = 0.05
+                pid_path = daemon.get_pid_file()
+                pid_path.parent.mkdir(parents=True, exist_ok=True)
+                pid_path.write_text("")
+                with self.assertLogs("claude_stt.daemon", level="WARNING"):
+                    self.assertTrue(daemon._claim_pid_file(12345))
+                self.assertEqual(daemon._read_pid_file()["pid"], 12345)
+            finally:
+                daemon._PID_FILE_WRITE_GRACE = original_grace
+                os.environ.pop("CLAUDE_STT_CONFIG_DIR", None)
+
 
 if __name__ == "__main__":
     unittest.main()
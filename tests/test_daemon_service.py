@@ -0,0 +1,74 @@
+import threading
+import unittest
+
+import numpy as np
+
+from claude_stt import daemon_service
+from claude_stt.config import Config
+
+
+class FakeRecorder:
+    def __init__(self):
+        self.starts = 0
+        self.stops = 0
+        self.stopped = threading.Event()
+
+    def start(self):
+        self.starts += 1
+        return True
+
+    def stop(self):
+        self.stops += 1
+        self.stopped.set()
+        return np.ones(4, dtype=np.float32)
+
+
+class RecordingTimerTests(unittest.TestCase):
+    def setUp(self):
+        self._original_get_window = daemon_service.get_active_window
+        daemon_service.get_active_window = lambda: None
+        self.daemon = daemon_service.STTDaemon(Config(sound_effects=False))
+        self.recorder = FakeRecorder()
+        self.daemon._recorder = self.recorder
+
+    def tearDown(self):
+        self.daemon.stop()
+        daemon_service.get_active_window = self._original_get_window
+
+    def test_timer_stops_recording_after_max_duration(self):
+        self.daemon.config.max_recording_seconds = 0.05
+        self.daemon._on_recording_start()
+        self.assertTrue(self.recorder.stopped.wait(2.0))
+        self.assertFalse(self.daemon._recording)
+        self.assertEqual(self.daemon._transcribe_queue.qsize(), 1)
+
+    def test_stale_session_timer_is_noop(self):
+        self.daemon.config.max_recording_seconds = 60
+        self.daemon._on_recording_start()
+        stale = self.daemon._record_timers[-1]
+        self.daemon._on_recording_stop()
+        self.daemon._on_recording_start()
+        self.assertEqual(self.recorder.starts, 2)
+        self.assertEqual(self.recorder.stops, 1)
+
+        # Fire the first session's auto-stop as if it raced the cancel.
+        stale.function(*stale.args, **stale.kwargs)
+        self.assertTrue(self.daemon._recording)
+        self.assertEqual(self.recorder.stops, 1)
+
+    def test_stop_cancels_pending_timers(self):
+        self.daemon.config.max_recording_seconds = 0.05
+        self.daemon._on_recording_start()
+        timers = list(self.daemon._record_timers)
+        self.daemon.stop()
+        self.assertEqual(self.daemon._record_timers, [])
+        for timer in timers:
+            timer.join(1.0)
+            self.assertTrue(timer.finished.is_set())
+        # stop() releases the recorder itself; the timer never fired.
+        self.assertEqual(self.recorder.stops, 1)
+        self.assertTrue(self.daemon._transcribe_queue.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
+import sys
+import types
 import unittest
 
 from claude_stt.config import Config
 from claude_stt.engine_factory import build_engine
+from claude_stt.engines import moonshine
 from claude_stt.engines.whisper import WhisperEngine
 from claude_stt.errors import EngineError
 
@@ -19,6 +22,58 @@ class EngineFactoryTests(unittest.TestCase):
         engine = build_engine(config)
         self.assertIsInstance(engine, WhisperEngine)
 
+    def test_moonshine_unavailable_when_import_fails(self):
+        original_available = moonshine._moonshine_available
+        original_module = sys.modules.get("moonshine_onnx")
+        try:
+            moonshine._moonshine_available = None
+            # A None entry makes the import raise ImportError.
+            sys.modules["moonshine_onnx"] = None
+            self.assertFalse(moonshine.MoonshineEngine().is_available())
+        finally:
+            moonshine._moonshine_available = original_available
+            if original_module is None:
+                sys.modules.pop("moonshine_onnx", None)
+            else:
+                sys.modules["moonshine_onnx"] = original_module
+
+    def test_moonshine_failed_tokenizer_load_leaves_engine_unloaded(self):
+        fake = types.ModuleType("moonshine_onnx")
+        fake_transcribe = types.ModuleType("moonshine_onnx.transcribe")
+        fake.MoonshineOnnxModel = lambda **kwargs: object()
+        fake_transcribe.assert_audio_size = lambda audio: None
+        tokenizers = []
+
+        def load_tokenizer():
+            if not tokenizers:
+                tokenizers.append("failed")
+                raise OSError("tokenizer missing")
+            return "tokenizer"
+
+        fake.load_tokenizer = load_tokenizer
+        original_available = moonshine._moonshine_available
+        original_modules = {
+            name: sys.modules.get(name)
+            for name in ("moonshine_onnx", "moonshine_onnx.transcribe")
+        }
+        try:
+            moonshine._moonshine_available = True
+            sys.modules["moonshine_onnx"] = fake
+            sys.modules["moonshine_onnx.transcribe"] = fake_transcribe
+            engine = moonshine.MoonshineEngine()
+            with self.assertLogs("claude_stt.engines.moonshine", level="ERROR"):
+                self.assertFalse(engine.load_model())
+            self.assertIsNone(engine._model)
+            self.assertTrue(engine.load_model())
+            self.assertEqual(engine._tokenizer, "tokenizer")
+        finally:
+            moonshine._moonshine_available = original_available
+            for name, module in original_modules.items():
+                if module is None:
+                    sys.modules.pop(name, None)
+                else:
+                    sys.modules[name] = module
+
 
 if __name__ == "__main__":
     unittest.main()
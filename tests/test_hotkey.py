@@ -69,6 +69,24 @@ class HotkeyListenerTests(unittest.TestCase):
         self._release_hotkey(listener)
         self.assertEqual(self._next_event(events), "stop")
 
+    def test_side_specific_modifiers_and_uppercase_chars_match(self):
+        events: "queue.Queue[str]" = queue.Queue()
+
+        listener = HotkeyListener(
+            hotkey="ctrl+shift+r",
+            mode="push-to-talk",
+            on_start=lambda: events.put("start"),
+            on_stop=lambda: events.put("stop"),
+        )
+
+        listener._on_press(keyboard.Key.ctrl_l)
+        listener._on_press(keyboard.Key.shift_r)
+        listener._on_press(keyboard.KeyCode.from_char("R"))
+        self.assertEqual(self._next_event(events), "start")
+
+        listener._on_release(keyboard.Key.shift_r)
+        self.assertEqual(self._next_event(events), "stop")
+
     def test_invalid_hotkey_rejected(self):
         with self.assertRaises(HotkeyError):
             HotkeyListener(hotkey="")
@@ -1,3 +1,6 @@
+import contextlib
+import sys
+import types
 import unittest
 
 from claude_stt.config import Config
@@ -31,6 +34,109 @@ class KeyboardOutputTests(unittest.TestCase):
             keyboard._injection_checked_at = original_checked
             keyboard._injection_capable = original_capable
 
+    def test_long_injection_uses_paste(self):
+        original_available = keyboard._PYNPUT_AVAILABLE
+        original_paste = keyboard._output_via_paste
+        original_get_keyboard = keyboard.get_keyboard
+        original_wayland = keyboard.is_wayland
+        try:
+            keyboard._PYNPUT_AVAILABLE = True
+            keyboard.is_wayland = lambda: False
+            pasted = []
+            typed = []
+
+            class FakeKeyboard:
+                def type(self, text):
+                    typed.append(text)
+
+            keyboard._output_via_paste = lambda text: pasted.append(text) or True
+            keyboard.get_keyboard = lambda: FakeKeyboard()
+            config = Config(output_mode="injection", sound_effects=False, paste_threshold=10)
+
+            self.assertTrue(keyboard.output_text("short", config=config))
+            self.assertTrue(keyboard.output_text("a much longer sentence", config=config))
+            self.assertEqual(typed, ["short"])
+            self.assertEqual(pasted, ["a much longer sentence"])
+        finally:
+            keyboard._PYNPUT_AVAILABLE = original_available
+            keyboard._output_via_paste = original_paste
+            keyboard.get_keyboard = original_get_keyboard
+            keyboard.is_wayland = original_wayland
+
+
+class PasteOutputTests(unittest.TestCase):
+    def setUp(self):
+        self.clipboard = ["previous contents"]
+        self.events = []
+        fake_pyperclip = types.ModuleType("pyperclip")
+        fake_pyperclip.PyperclipException = type("PyperclipException", (RuntimeError,), {})
+        # Mirrors pyperclip 1.11: reports unavailable until first use.
+        fake_pyperclip.is_available = lambda: False
+        fake_pyperclip.paste = lambda: self.clipboard[-1]
+        fake_pyperclip.copy = self.clipboard.append
+        self._original_pyperclip = sys.modules.get("pyperclip")
+        self._original_get_keyboard = keyboard.get_keyboard
+        self._original_delay = keyboard._paste_restore_delay
+        self._original_modifiers = keyboard._paste_modifiers
+        sys.modules["pyperclip"] = fake_pyperclip
+        keyboard._paste_restore_delay = 0
+        # Key is None when pynput cannot load (headless CI).
+        keyboard._paste_modifiers = lambda: ("ctrl", "shift")
+
+    def tearDown(self):
+        if self._original_pyperclip is None:
+            sys.modules.pop("pyperclip", None)
+        else:
+            sys.modules["pyperclip"] = self._original_pyperclip
+        keyboard.get_keyboard = self._original_get_keyboard
+        keyboard._paste_restore_delay = self._original_delay
+        keyboard._paste_modifiers = self._original_modifiers
+
+    def _fake_keyboard(self, fail=False):
+        events = self.events
+        clipboard = self.clipboard
+
+        class FakeKeyboard:
+            @contextlib.contextmanager
+            def pressed(self, *keys):
+                events.append(("press", keys))
+                yield
+                events.append(("release", keys))
+
+            def tap(self, key):
+                if fail:
+                    raise RuntimeError("injection blocked")
+                events.append(("tap", key, clipboard[-1]))
+
+        return FakeKeyboard()
+
+    def test_paste_sends_shortcut_and_restores_clipboard(self):
+        keyboard.get_keyboard = lambda: self._fake_keyboard()
+        self.assertTrue(keyboard._output_via_paste("dictated text"))
+        self.assertEqual(
+            self.events,
+            [
+                ("press", ("ctrl", "shift")),
+                ("tap", "v", "dictated text"),
+                ("release", ("ctrl", "shift")),
+            ],
+        )
+        self.assertEqual(self.clipboard[-1], "previous contents")
+
+    def test_failed_shortcut_still_restores_clipboard(self):
+        keyboard.get_keyboard = lambda: self._fake_keyboard(fail=True)
+
+        self.assertFalse(keyboard._output_via_paste("dictated text"))
+        self.assertEqual(self.clipboard[-1], "previous contents")
+
+    def test_non_text_clipboard_is_not_overwritten_with_empty_text(self):
+        # pyperclip returns "" when the clipboard holds an image or files.
+        self.clipboard[:] = [""]
+        keyboard.get_keyboard = lambda: self._fake_keyboard()
+
+        self.assertTrue(keyboard._output_via_paste("dictated text"))
+        self.assertEqual(self.clipboard, ["", "dictated text"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,71 @@
+import types
+import unittest
+
+import numpy as np
+
+from claude_stt import recorder
+from claude_stt.recorder import AudioRecorder, RecorderConfig
+
+
+class FakeInputStream:
+    def __init__(self, callback, **kwargs):
+        self.callback = callback
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class RecorderBufferTests(unittest.TestCase):
+    def setUp(self):
+        self._original_sd = recorder.sd
+        self._original_initial = recorder._UNBOUNDED_INITIAL_FRAMES
+        recorder.sd = types.SimpleNamespace(InputStream=FakeInputStream)
+
+    def tearDown(self):
+        recorder.sd = self._original_sd
+        recorder._UNBOUNDED_INITIAL_FRAMES = self._original_initial
+
+    def _record(self, config, blocks):
+        audio_recorder = AudioRecorder(config)
+        self.assertTrue(audio_recorder.start())
+        for block in blocks:
+            audio_recorder._stream.callback(block.reshape(-1, 1), len(block), None, None)
+        return audio_recorder.stop()
+
+    def test_capped_recording_keeps_latest_frames_across_wrap(self):
+        # 2s at 4Hz with blocks of 2 frames: a ring of 8 frames.
+        config = RecorderConfig(
+            sample_rate=4, blocksize=2, queue_maxsize=0, max_recording_seconds=2
+        )
+        blocks = [np.arange(i, i + 2, dtype=np.float32) for i in range(0, 22, 2)]
+        audio = self._record(config, blocks)
+        np.testing.assert_array_equal(audio, np.arange(14, 22, dtype=np.float32))
+
+    def test_capped_recording_keeps_tail_of_oversized_block(self):
+        config = RecorderConfig(
+            sample_rate=4, blocksize=2, queue_maxsize=0, max_recording_seconds=2
+        )
+        audio = self._record(config, [np.arange(13, dtype=np.float32)])
+        np.testing.assert_array_equal(audio, np.arange(5, 13, dtype=np.float32))
+
+    def test_unbounded_recording_grows_past_initial_buffer(self):
+        recorder._UNBOUNDED_INITIAL_FRAMES = 4
+        config = RecorderConfig(
+            sample_rate=4, blocksize=3, queue_maxsize=0, max_recording_seconds=None
+        )
+        blocks = [np.arange(i, i + 3, dtype=np.float32) for i in range(0, 15, 3)]
+        audio = self._record(config, blocks)
+        np.testing.assert_array_equal(audio, np.arange(15, dtype=np.float32))
+
+    def test_stop_without_audio_returns_none(self):
+        self.assertIsNone(self._record(RecorderConfig(queue_maxsize=0), []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import shutil
+import threading
+import time
+import unittest
+
+from claude_stt import sounds
+
+
+@unittest.skipUnless(hasattr(os, "posix_spawn"), "posix_spawn not available")
+class SoundPlayerTests(unittest.TestCase):
+    def test_spawned_players_are_reaped(self):
+        true_path = shutil.which("true")
+        if true_path is None:
+            self.skipTest("true not available")
+        sounds._spawn_player((true_path,), "ignored.oga")
+        self.assertEqual(len(sounds._spawned_pids), 1)
+        deadline = time.monotonic() + 5.0
+        while sounds._spawned_pids and time.monotonic() < deadline:
+            with sounds._spawn_lock:
+                sounds._reap_players()
+            time.sleep(0.01)
+        self.assertEqual(sounds._spawned_pids, [])
+
+    def test_popen_fallback_players_are_reaped(self):
+        true_path = shutil.which("true")
+        if true_path is None:
+            self.skipTest("true not available")
+        original_actions = sounds._SPAWN_FILE_ACTIONS
+        try:
+            sounds._SPAWN_FILE_ACTIONS = None
+            sounds._spawn_player((true_path,), "ignored.oga")
+            self.assertEqual(len(sounds._spawned_procs), 1)
+            sounds._spawned_procs[0].wait(timeout=5.0)
+            with sounds._spawn_lock:
+                sounds._reap_players()
+            self.assertEqual(sounds._spawned_procs, [])
+        finally:
+            sounds._SPAWN_FILE_ACTIONS = original_actions
+
+
+class SoundQueueTests(unittest.TestCase):
+    def test_play_sound_runs_on_background_worker(self):
+        original_play = sounds._PLAY
+        played = []
+        done = threading.Event()
+
+        def fake_play(event):
+            played.append((event, threading.current_thread().name))
+            done.set()
+
+        try:
+            sounds._PLAY = fake_play
+            sounds._last_played.clear()
+            sounds.play_sound("start")
+            self.assertTrue(done.wait(timeout=5.0))
+        finally:
+            sounds._PLAY = original_play
+        self.assertEqual(played, [("start", "claude-stt-sounds")])
+
+    def test_rapid_duplicate_events_are_coalesced(self):
+        original_play = sounds._PLAY
+        original_last_played = dict(sounds._last_played)
+        played = []
+        done = threading.Event()
+
+        def fake_play(event):
+            played.append(event)
+            if event == "complete":
+                done.set()
+
+        try:
+            sounds._PLAY = fake_play
+            sounds._last_played.clear()
+            sounds.play_sound("stop")
+            sounds.play_sound("stop")
+            sounds.play_sound("complete")
+            self.assertTrue(done.wait(timeout=5.0))
+        finally:
+            sounds._PLAY = original_play
+            sounds._last_played.clear()
+            sounds._last_played.update(original_last_played)
+        self.assertEqual(played, ["stop", "complete"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,222 @@
+import types
+import unittest
+
+from claude_stt import window
+
+
+class RestoreFocusTests(unittest.TestCase):
+    def setUp(self):
+        self._original_get_window = window._GET_WINDOW
+        self._original_restore = window._RESTORE_FOCUS
+        self._original_cheap = window._active_window_is_cheap
+        self.restored = []
+        window._RESTORE_FOCUS = {
+            window._SYSTEM: lambda info: self.restored.append(info) or True
+        }
+        window._active_window_is_cheap = lambda: True
+
+    def tearDown(self):
+        window._GET_WINDOW = self._original_get_window
+        window._RESTORE_FOCUS = self._original_restore
+        window._active_window_is_cheap = self._original_cheap
+
+    def test_restore_skipped_when_window_still_active(self):
+        target = window.WindowInfo(window_id="42", platform=window._SYSTEM)
+        window._GET_WINDOW = lambda: window.WindowInfo(window_id="42", platform=window._SYSTEM)
+        self.assertTrue(window.restore_focus(target))
+        self.assertEqual(self.restored, [])
+
+    def test_restore_runs_without_window_id_even_if_app_matches(self):
+        target = window.WindowInfo(
+            window_id="", platform=window._SYSTEM, app_name="Terminal", pid=42
+        )
+        window._GET_WINDOW = lambda: target
+        self.assertTrue(window.restore_focus(target))
+        self.assertEqual(self.restored, [target])
+
+    def test_restore_runs_when_another_window_is_active(self):
+        target = window.WindowInfo(window_id="42", platform=window._SYSTEM)
+        window._GET_WINDOW = lambda: window.WindowInfo(window_id="7", platform=window._SYSTEM)
+        self.assertTrue(window.restore_focus(target))
+        self.assertEqual(self.restored, [target])
+
+
+def _handle(value):
+    return getattr(value, "value", value)
+
+
+class FakeMacWindowAPI:
+    """Stands in for the CoreFoundation/CoreGraphics/AX calls via ctypes."""
+
+    owner_pid_key = "pid"
+    layer_key = "layer"
+    number_key = "number"
+    windows_attribute = "AXWindows"
+    raise_action = "AXRaise"
+
+    def __init__(self, windows, ax_windows):
+        # On-screen windows front to back, as (pid, layer, number).
+        self._objects = {
+            1: [
+                {"pid": ("n", pid), "layer": ("n", layer), "number": ("n", number)}
+                for pid, layer, number in windows
+            ],
+            2: list(ax_windows),
+        }
+        self.raised = []
+        self.released = []
+
+    def window_list(self, options, relative_to):
+        return 1
+
+    def array_count(self, array):
+        return len(self._objects[_handle(array)])
+
+    def array_item(self, array, index):
+        return self._objects[_handle(array)][index]
+
+    def dict_value(self, info, key):
+        return info[key]
+
+    def number_value(self, number, number_type, out):
+        out._obj.value = number[1]
+        return True
+
+    def app_element(self, pid):
+        return "app-%d" % pid
+
+    def copy_attribute(self, element, attribute, out):
+        out._obj.value = 2
+        return 0
+
+    def element_window(self, element, out):
+        out._obj.value = element
+        return 0
+
+    def perform_action(self, element, action):
+        self.raised.append((element, action))
+        return 0
+
+    def release(self, value):
+        self.released.append(_handle(value))
+
+
+class MacOSFocusTests(unittest.TestCase):
+    def setUp(self):
+        self._original_appkit = window._appkit
+        self._original_api = window._macos_window_api
+        self._original_run = window._run_applescript
+        self.activated = []
+        activated = self.activated
+
+        class RunningApp:
+            def activateWithOptions_(self, options):
+                activated.append(options)
+                return True
+
+        workspace = types.SimpleNamespace(
+            activeApplication=lambda: {
+                "NSApplicationProcessIdentifier": 42,
+                "NSApplicationName": "Terminal",
+            }
+        )
+        appkit = types.SimpleNamespace(
+            NSWorkspace=types.SimpleNamespace(sharedWorkspace=lambda: workspace),
+            NSRunningApplication=types.SimpleNamespace(
+                runningApplicationWithProcessIdentifier_=lambda pid: RunningApp()
+            ),
+            NSApplicationActivateIgnoringOtherApps=2,
+        )
+        window._appkit = lambda: appkit
+        self.api = FakeMacWindowAPI(
+            windows=[(7, 0, 100), (42, 25, 200), (42, 0, 301), (42, 0, 302)],
+            ax_windows=[302, 301],
+        )
+        window._macos_window_api = lambda: self.api
+
+        def no_applescript(script):
+            raise AssertionError("AppleScript should not run on the native path")
+
+        window._run_applescript = no_applescript
+
+    def tearDown(self):
+        window._appkit = self._original_appkit
+        window._macos_window_api = self._original_api
+        window._run_applescript = self._original_run
+
+    def test_native_capture_keeps_window_id_and_restore_raises_it(self):
+        info = window._get_macos_window()
+        self.assertEqual(
+            info,
+            window.WindowInfo(window_id="301", platform="Darwin", app_name="Terminal", pid=42),
+        )
+
+        self.assertTrue(window._restore_macos_focus(info))
+        self.assertEqual(self.activated, [2])
+        self.assertEqual(self.api.raised, [(301, "AXRaise")])
+        self.assertEqual(sorted(self.api.released, key=str), [1, 2, "app-42"])
+
+    def test_active_window_check_is_native_only_with_window_api(self):
+        original_system = window._SYSTEM
+        try:
+            window._SYSTEM = "Darwin"
+            self.assertTrue(window._active_window_is_cheap())
+            window._macos_window_api = lambda: None
+            self.assertFalse(window._active_window_is_cheap())
+        finally:
+            window._SYSTEM = original_system
+
+
+class FakeXDisplay:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class LinuxFocusTests(unittest.TestCase):
+    def setUp(self):
+        self._originals = {
+            name: getattr(window, name)
+            for name in (
+                "is_wayland",
+                "_xlib_connection",
+                "_activate_xlib_window",
+                "_xdotool_path",
+            )
+        }
+        self.display = FakeXDisplay()
+        self.cleared = []
+
+        def connection():
+            return self.display, object(), 1
+
+        connection.cache_clear = lambda: self.cleared.append(True)
+        window.is_wayland = lambda: False
+        window._xlib_connection = connection
+        window._xdotool_path = lambda: None
+        self.target = window.WindowInfo(window_id="42", platform="Linux")
+
+    def tearDown(self):
+        for name, value in self._originals.items():
+            setattr(window, name, value)
+
+    def test_restore_reports_unconfirmed_activation(self):
+        window._activate_xlib_window = lambda connection, window_id: False
+        self.assertFalse(window._restore_linux_focus(self.target))
+        window._activate_xlib_window = lambda connection, window_id: True
+        self.assertTrue(window._restore_linux_focus(self.target))
+
+    def test_failed_connection_is_closed_before_reconnect(self):
+        def broken(connection, window_id):
+            raise OSError("connection lost")
+
+        window._activate_xlib_window = broken
+        self.assertFalse(window._restore_linux_focus(self.target))
+        self.assertTrue(self.display.closed)
+        self.assertEqual(self.cleared, [True])
+
+
+if __name__ == "__main__":
+    unittest.main()